@@ -0,0 +1,44 @@
+"""Regenerate the PDF fixtures in tests/fixtures/.
+
+The fixtures are committed so the test suite does not need to build PDFs at
+runtime. Run this script after changing any of the definitions below:
+
+    python scripts/gen_fixtures.py
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from tests._pdfgen import minimal_pdf  # noqa: E402
+
+FIXTURES_DIR = ROOT / "tests" / "fixtures"
+
+FIXTURES = {
+    "minimal.pdf": minimal_pdf(
+        "Hello, pdfsmith!", "This is a test document.", "Page 1 of 1"
+    ),
+    "multipage.pdf": minimal_pdf(
+        "Page {page} Header",
+        "Content for page {page}",
+        "This is page {page} of {pages}",
+        pages=3,
+    ),
+    "empty.pdf": minimal_pdf(),
+    # Past Google Document AI's 15-page synchronous limit
+    "manypage_20.pdf": minimal_pdf("Page {page}", pages=20),
+}
+
+
+def main() -> None:
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    for name, data in FIXTURES.items():
+        pdf_path = FIXTURES_DIR / name
+        pdf_path.write_bytes(data)
+        print(f"Wrote {pdf_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,7 +18,27 @@ Basic usage:
     print(available_backends())
 """
 
-from pdfsmith.api import available_backends, get_backend, parse, parse_async
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pdfsmith.api import available_backends, get_backend, parse, parse_async
 
 __version__ = "0.2.0"
 __all__ = ["parse", "parse_async", "available_backends", "get_backend", "__version__"]
+
+# Public API names resolved from pdfsmith.api on first access (PEP 562)
+_LAZY_ATTRS = frozenset({"parse", "parse_async", "available_backends", "get_backend"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRS:
+        from pdfsmith import api
+
+        value = getattr(api, name)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_ATTRS)
@@ -4,6 +4,7 @@ Core API for pdfsmith.
 Provides a simple interface to parse PDFs to markdown using various backends.
 """
 
+import asyncio
 from pathlib import Path
 from typing import Literal
 
@@ -140,11 +141,10 @@ async def parse_async(
 
     backend_instance = get_backend(backend)
 
-    # Use async method if available, otherwise run sync in executor
+    # Use async method if available, otherwise run sync in executor so file
+    # reads and parsing happen off the event loop
     if hasattr(backend_instance, "parse_async"):
         return await backend_instance.parse_async(pdf_path)
     else:
-        import asyncio
-
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, backend_instance.parse, pdf_path)
@@ -141,7 +141,17 @@ class DatabricksBackend(BaseBackend):
             raise RuntimeError(f"Databricks parsing failed: {e}") from e
 
     def _parse_result(self, result_json: str) -> str:
-        """Parse ai_parse_document JSON result to markdown."""
+        """Parse ai_parse_document JSON result to markdown.
+
+        Only a JSON object or array is treated as a structured result.
+        Anything else, including plain text and bare JSON scalars such as
+        ``42`` or ``"text"``, is returned unchanged.
+        """
+        # Plain-text results can't be a JSON object or array; skip the parser
+        stripped = result_json.lstrip()
+        if not stripped or stripped[0] not in "{[":
+            return result_json
+
         try:
             result = json.loads(result_json)
 
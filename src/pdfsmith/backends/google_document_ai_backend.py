@@ -11,23 +11,37 @@ Configuration:
     GOOGLE_CLOUD_PROJECT (project ID), and optionally
     GOOGLE_DOCUMENT_AI_PROCESSOR_ID.
 
+    Set GOOGLE_DOCUMENT_AI_GCS_URI (e.g. gs://my-bucket/pdfsmith) to enable
+    batch processing for documents over the synchronous page limit.
+
 Cost: $1.50 per 1,000 pages (Document OCR)
 Limits: 15 pages (synchronous), 500 pages (async with GCS)
 
-Note: This backend uses synchronous API only (15 page limit).
-For larger documents, use async batch processing in pdf-bench.
+Note: Documents up to 15 pages use the synchronous API. Larger documents
+are staged to GCS and sent through batch processing when
+GOOGLE_DOCUMENT_AI_GCS_URI is set; otherwise they are rejected.
 """
 
+import uuid
+from concurrent.futures import TimeoutError as OperationTimeout
 from pathlib import Path
 
 try:
     from google.api_core.client_options import ClientOptions
+    from google.api_core.exceptions import InvalidArgument, ResourceExhausted
     from google.cloud import documentai_v1 as documentai
 
     AVAILABLE = True
 except ImportError:
     AVAILABLE = False
 
+try:
+    from google.cloud import storage  # type: ignore[attr-defined]
+
+    STORAGE_AVAILABLE = True
+except ImportError:
+    STORAGE_AVAILABLE = False
+
 from pdfsmith.backends.registry import BaseBackend
 
 
@@ -36,6 +50,15 @@ class GoogleDocumentAIBackend(BaseBackend):
 
     name = "google_document_ai"
 
+    # Synchronous API page limit; larger documents need batch processing
+    SYNC_PAGE_LIMIT = 15
+
+    # Batch API page limit
+    BATCH_PAGE_LIMIT = 500
+
+    # Seconds to wait for a batch processing operation to finish
+    BATCH_TIMEOUT = 600
+
     def __init__(self) -> None:
         """Initialize Google Document AI backend."""
         if not AVAILABLE:
@@ -50,6 +73,7 @@ class GoogleDocumentAIBackend(BaseBackend):
         project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
         location = os.getenv("GOOGLE_CLOUD_LOCATION", "us")
         processor_id = os.getenv("GOOGLE_DOCUMENT_AI_PROCESSOR_ID")
+        gcs_uri = os.getenv("GOOGLE_DOCUMENT_AI_GCS_URI")
 
         if not credentials_path:
             raise RuntimeError(
@@ -66,6 +90,12 @@ class GoogleDocumentAIBackend(BaseBackend):
                 "Create an OCR processor in Google Cloud Console."
             )
 
+        if gcs_uri and not STORAGE_AVAILABLE:
+            raise ImportError(
+                "google-cloud-storage is required for batch processing. "
+                "Install with: pip install google-cloud-storage"
+            )
+
         # Initialize client
         opts = ClientOptions(api_endpoint=f"{location}-documentai.googleapis.com")
         self.client = documentai.DocumentProcessorServiceClient(client_options=opts)
@@ -75,11 +105,14 @@ class GoogleDocumentAIBackend(BaseBackend):
             f"projects/{project_id}/locations/{location}/processors/{processor_id}"
         )
 
+        # GCS staging location for batch processing (None disables it)
+        self.gcs_uri = gcs_uri
+
     def parse(self, pdf_path: Path) -> str:
         """Parse PDF to markdown using Google Document AI.
 
-        Note: Synchronous API has 15 page limit. For larger documents,
-        the API will fail with an error.
+        Note: Synchronous API has 15 page and 20 MB limits. Larger documents
+        are sent through batch processing if GOOGLE_DOCUMENT_AI_GCS_URI is set.
 
         Args:
             pdf_path: Path to PDF file
@@ -88,19 +121,27 @@ class GoogleDocumentAIBackend(BaseBackend):
             Markdown text
 
         Raises:
-            ValueError: If PDF exceeds 15 pages or size limits
+            ValueError: If PDF exceeds 20 MB or 15 pages without GCS staging
+                configured, or 500 pages with it
             RuntimeError: If API call fails
         """
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
+        # Over the synchronous limits, batch_uri is the GCS staging URI
+        batch_uri: str | None = None
+
         # Check file size (20 MB limit for synchronous)
         file_size_mb = pdf_path.stat().st_size / (1024 * 1024)
         if file_size_mb > 20:
-            raise ValueError(
-                f"PDF too large ({file_size_mb:.1f} MB). "
-                "Google Document AI has 20 MB limit for synchronous API."
-            )
+            if not self.gcs_uri:
+                raise ValueError(
+                    f"PDF too large ({file_size_mb:.1f} MB). "
+                    "Google Document AI has 20 MB limit for synchronous API. "
+                    "Set GOOGLE_DOCUMENT_AI_GCS_URI to enable batch "
+                    "processing for larger documents."
+                )
+            batch_uri = self.gcs_uri
 
         # Check page count
         try:
@@ -110,16 +151,27 @@ class GoogleDocumentAIBackend(BaseBackend):
             page_count = len(pdf_doc)
             pdf_doc.close()
 
-            if page_count > 15:
+            if page_count > self.BATCH_PAGE_LIMIT:
                 raise ValueError(
                     f"PDF has {page_count} pages. "
-                    "Synchronous API limited to 15 pages. "
-                    "Use async batch processing for larger documents."
+                    "Batch processing limited to 500 pages."
                 )
+            if page_count > self.SYNC_PAGE_LIMIT:
+                if not self.gcs_uri:
+                    raise ValueError(
+                        f"PDF has {page_count} pages. "
+                        "Synchronous API limited to 15 pages. "
+                        "Set GOOGLE_DOCUMENT_AI_GCS_URI to enable batch "
+                        "processing for larger documents."
+                    )
+                batch_uri = self.gcs_uri
         except ImportError:
             pass  # Skip page check if pymupdf not available
 
         try:
+            if batch_uri:
+                return self._parse_batch(pdf_path, batch_uri)
+
             # Read PDF
             pdf_content = pdf_path.read_bytes()
 
@@ -138,14 +190,103 @@ class GoogleDocumentAIBackend(BaseBackend):
             # Extract text
             return self._extract_text(result.document)
 
+        except InvalidArgument as e:
+            raise ValueError(f"Invalid PDF: {e}") from e
+
+        except ResourceExhausted as e:
+            raise RuntimeError(f"Google rate limit exceeded: {e}") from e
+
+        except RuntimeError:
+            raise  # Batch failures are already descriptive
+
         except Exception as e:
-            error_msg = str(e)
-            if "INVALID_ARGUMENT" in error_msg:
-                raise ValueError(f"Invalid PDF: {error_msg}") from e
-            elif "RESOURCE_EXHAUSTED" in error_msg:
-                raise RuntimeError(f"Google rate limit exceeded: {error_msg}") from e
-            else:
-                raise RuntimeError(f"Google Document AI error: {error_msg}") from e
+            raise RuntimeError(f"Google Document AI error: {e}") from e
+
+    def _parse_batch(self, pdf_path: Path, gcs_uri: str) -> str:
+        """Parse PDF using the batch processing API with GCS staging.
+
+        Uploads the PDF under a unique prefix in gcs_uri (gs://bucket or
+        gs://bucket/prefix), waits for the batch operation, reads back the
+        sharded output documents, and removes everything it staged.
+        """
+        bucket_name, _, prefix = gcs_uri.removeprefix("gs://").partition("/")
+        job_prefix = f"pdfsmith-{uuid.uuid4().hex}"
+        if prefix.strip("/"):
+            job_prefix = f"{prefix.strip('/')}/{job_prefix}"
+
+        storage_client = storage.Client()
+        bucket = storage_client.bucket(bucket_name)
+
+        try:
+            input_blob = bucket.blob(f"{job_prefix}/input/{pdf_path.name}")
+            input_blob.upload_from_filename(
+                str(pdf_path), content_type="application/pdf"
+            )
+
+            request = documentai.BatchProcessRequest(
+                name=self.processor_name,
+                input_documents=documentai.BatchDocumentsInputConfig(
+                    gcs_documents=documentai.GcsDocuments(
+                        documents=[
+                            documentai.GcsDocument(
+                                gcs_uri=f"gs://{bucket_name}/{input_blob.name}",
+                                mime_type="application/pdf",
+                            )
+                        ]
+                    )
+                ),
+                document_output_config=documentai.DocumentOutputConfig(
+                    gcs_output_config=documentai.DocumentOutputConfig.GcsOutputConfig(
+                        gcs_uri=f"gs://{bucket_name}/{job_prefix}/output/"
+                    )
+                ),
+            )
+
+            # Long-running operation; blocks until processing finishes
+            operation = self.client.batch_process_documents(request=request)
+            try:
+                operation.result(timeout=self.BATCH_TIMEOUT)
+            except OperationTimeout as e:
+                raise RuntimeError(
+                    f"Batch processing did not finish within {self.BATCH_TIMEOUT}s"
+                ) from e
+
+            # A failed document still completes the operation; its status
+            # says why, and it leaves no output behind
+            metadata = operation.metadata
+            failures = [
+                status.status.message
+                for status in (metadata.individual_process_statuses if metadata else [])
+                if status.status.code
+            ]
+            if failures:
+                raise RuntimeError(f"Batch processing failed: {'; '.join(failures)}")
+
+            # Output may be split into several shards, each a Document JSON
+            shards = [
+                documentai.Document.from_json(
+                    blob.download_as_bytes(), ignore_unknown_fields=True
+                )
+                for blob in storage_client.list_blobs(
+                    bucket_name, prefix=f"{job_prefix}/output/"
+                )
+                if blob.name.endswith(".json")
+            ]
+            if not shards:
+                raise RuntimeError("Batch processing produced no output documents")
+            shards.sort(key=lambda doc: int(doc.shard_info.shard_index))
+
+            texts = [self._extract_text(doc) for doc in shards]
+            return "\n\n".join(text for text in texts if text).strip()
+
+        finally:
+            try:
+                for blob in storage_client.list_blobs(
+                    bucket_name, prefix=f"{job_prefix}/"
+                ):
+                    blob.delete()
+            except Exception:
+                pass  # Best effort cleanup; don't mask the batch result or error
 
     def _extract_text(self, document) -> str:
         """Extract text from Document AI response."""
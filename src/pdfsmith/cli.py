@@ -7,8 +7,8 @@ from pathlib import Path
 from pdfsmith import __version__, available_backends, parse
 
 
-def main() -> int:
-    """Main CLI entry point."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the pdfsmith CLI."""
     parser = argparse.ArgumentParser(
         prog="pdfsmith",
         description="Convert PDF files to Markdown",
@@ -39,6 +39,12 @@ def main() -> int:
     # Backends command
     subparsers.add_parser("backends", help="List available backends")
 
+    return parser
+
+
+def main() -> int:
+    """Main CLI entry point."""
+    parser = _build_parser()
     args = parser.parse_args()
 
     if args.command == "parse":
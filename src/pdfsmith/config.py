@@ -13,22 +13,46 @@ Example usage:
     # Returns merged config from all sources
 """
 
+import copy
+import functools
 import os
+import time
+from collections import ChainMap
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar
 
-import yaml
+# Shared read-only empty mapping, handed out instead of allocating new dicts
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BackendConfig:
-    """Configuration container for a backend."""
+    """Configuration container for a backend.
+
+    Immutable once built; options are exposed as a read-only mapping.
+    """
 
     backend_name: str
-    options: dict[str, Any] = field(default_factory=dict)
+    options: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_MAPPING)
     source: str = "defaults"  # Where the config came from
 
+    # Strings get_bool() treats as true (compared lowercased)
+    _TRUTHY: ClassVar[frozenset[str]] = frozenset({"true", "1", "yes", "on"})
+
+    # Options are a mapping, so configs compare by value but aren't hashable
+    __hash__ = None  # type: ignore[assignment]
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.options, MappingProxyType):
+            object.__setattr__(self, "options", MappingProxyType(self.options))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # mappingproxy can't be pickled; rebuild it from a plain dict
+        return (type(self), (self.backend_name, dict(self.options), self.source))
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get a config value."""
         return self.options.get(key, default)
@@ -41,7 +65,7 @@ class BackendConfig:
         if isinstance(val, bool):
             return val
         if isinstance(val, str):
-            return val.lower() in ("true", "1", "yes", "on")
+            return val.lower() in self._TRUTHY
         return bool(val)
 
     def get_int(self, key: str, default: int = 0) -> int:
@@ -54,23 +78,89 @@ class BackendConfig:
 
 def _find_config_file(backend_name: str) -> Path | None:
     """Find config file for backend, checking multiple locations."""
-    # Project-local config
-    local_config = Path(f".pdfsmith/{backend_name}.yaml")
-    if local_config.exists():
-        return local_config
+    filename = f"{backend_name}.yaml"
+
+    # Project-local config (returned relative, as seen from cwd)
+    if filename in _config_dir_entries(Path.cwd() / ".pdfsmith"):
+        return Path(".pdfsmith") / filename
 
     # User config
-    user_config = Path.home() / ".config" / "pdfsmith" / f"{backend_name}.yaml"
-    if user_config.exists():
-        return user_config
+    user_dir = Path.home() / ".config" / "pdfsmith"
+    if filename in _config_dir_entries(user_dir):
+        return user_dir / filename
 
     return None
 
 
+# Config directory listings by path, with the directory mtime_ns they were read at
+_DIR_CACHE: dict[Path, tuple[int, frozenset[str]]] = {}
+
+# Directories modified this recently are re-listed on every lookup: a change
+# in the same timestamp tick as a cached listing would not move the mtime
+_DIR_SETTLE_NS = 2_000_000_000
+
+
+def _config_dir_entries(directory: Path) -> frozenset[str]:
+    """Names in a config directory, shared by every backend.
+
+    Listings are cached until the directory's mtime changes, which happens
+    whenever a config file is created, renamed or deleted in it.
+    """
+    try:
+        mtime_ns = directory.stat().st_mtime_ns
+        cached = _DIR_CACHE.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        with os.scandir(directory) as entries:
+            names = frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+    if time.time_ns() - mtime_ns >= _DIR_SETTLE_NS:
+        _DIR_CACHE[directory] = (mtime_ns, names)
+    return names
+
+
+def clear_config_cache() -> None:
+    """Forget cached config lookups and parsed files so the next load re-reads."""
+    _DIR_CACHE.clear()
+    _YAML_CACHE.clear()
+
+
+# Parsed config files by absolute path, with the (mtime_ns, size) they were read at
+_YAML_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml_loader() -> Callable[[bytes], Any]:
+    """Import PyYAML on first use and return its safe load function.
+
+    Deferred so importing pdfsmith.config doesn't pay for yaml when no
+    config file exists. Uses the libyaml-backed loader when PyYAML was
+    built with it; same safe semantics.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return functools.partial(yaml.load, Loader=loader)
+
+
 def _load_yaml_config(path: Path) -> dict[str, Any]:
-    """Load YAML config file."""
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    """Load YAML config file.
+
+    Parsed contents are cached until the file's mtime or size changes. Each
+    call returns a deep copy, so nested lists and dicts are never shared
+    between callers.
+    """
+    key = path.absolute()
+    st = key.stat()
+    cached = _YAML_CACHE.get(key)
+    if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+        # Bytes let the YAML reader detect the encoding itself (UTF-8 by spec)
+        data = key.read_bytes()
+        cached = (st.st_mtime_ns, st.st_size, _yaml_loader()(data) or {})
+        _YAML_CACHE[key] = cached
+    return copy.deepcopy(cached[2])
 
 
 def _load_env_config(backend_name: str, known_options: list[str]) -> dict[str, Any]:
@@ -83,15 +173,12 @@ def _load_env_config(backend_name: str, known_options: list[str]) -> dict[str, A
         PDFSMITH_DOCLING_THREADS=4
     """
     config = {}
-    backend_upper = backend_name.upper().replace("-", "_")
-
-    for option in known_options:
-        option_upper = option.upper()
+    environ = os.environ
 
+    for option, env_keys in _env_keys(backend_name, tuple(known_options)):
         # Try both formats
-        for prefix in [f"PDFSMITH_{backend_upper}_", f"{backend_upper}_"]:
-            env_key = f"{prefix}{option_upper}"
-            val = os.environ.get(env_key)
+        for env_key in env_keys:
+            val = environ.get(env_key)
             if val is not None:
                 config[option] = val
                 break
@@ -99,6 +186,24 @@ def _load_env_config(backend_name: str, known_options: list[str]) -> dict[str, A
     return config
 
 
+@functools.lru_cache(maxsize=64)
+def _env_keys(
+    backend_name: str, known_options: tuple[str, ...]
+) -> tuple[tuple[str, tuple[str, str]], ...]:
+    """Env var names to try for each option, in precedence order."""
+    backend_upper = backend_name.upper().replace("-", "_")
+    return tuple(
+        (
+            option,
+            (
+                f"PDFSMITH_{backend_upper}_{option.upper()}",
+                f"{backend_upper}_{option.upper()}",
+            ),
+        )
+        for option in known_options
+    )
+
+
 def load_backend_config(
     backend_name: str,
     explicit_options: dict[str, Any] | None = None,
@@ -116,54 +221,81 @@ def load_backend_config(
         BackendConfig with merged options from all sources
     """
     known_options = known_options or []
-    merged_options: dict[str, Any] = {}
+    # Highest priority first; the ChainMap resolves lookups without copying
+    layers: list[dict[str, Any]] = []
     source = "defaults"
 
     # 1. Load from config file (lowest priority file source)
     config_path = _find_config_file(backend_name)
     if config_path:
-        file_options = _load_yaml_config(config_path)
-        merged_options.update(file_options)
+        layers.insert(0, _load_yaml_config(config_path))
         source = str(config_path)
 
     # 2. Override with environment variables
     env_options = _load_env_config(backend_name, known_options)
     if env_options:
-        merged_options.update(env_options)
+        layers.insert(0, env_options)
         source = "environment"
 
     # 3. Override with explicit options (highest priority)
     if explicit_options:
-        merged_options.update(explicit_options)
+        # Copied so later changes to the caller's dict can't reach the config
+        layers.insert(0, dict(explicit_options))
         source = "explicit"
 
+    if not layers:
+        return _defaults_only_config(backend_name)
+
     return BackendConfig(
         backend_name=backend_name,
-        options=merged_options,
+        options=ChainMap(*layers),
         source=source,
     )
 
 
-# Default configurations for backends that need them
-BACKEND_DEFAULTS: dict[str, dict[str, Any]] = {
-    "docling": {
-        "do_ocr": False,  # Disabled by default for performance
-        "do_table_structure": True,
-        "num_threads": 4,
-        "device": "auto",
-        "ocr_languages": ["en"],
-    },
-    "marker": {
-        "use_llm": False,
-        "batch_size": 4,
-    },
-    "unstructured": {
-        "strategy": "fast",
-        "include_page_breaks": True,
-    },
-}
-
-
-def get_backend_defaults(backend_name: str) -> dict[str, Any]:
-    """Get default configuration for a backend."""
-    return BACKEND_DEFAULTS.get(backend_name, {}).copy()
+@functools.lru_cache(maxsize=64)
+def _defaults_only_config(backend_name: str) -> BackendConfig:
+    """Shared config for a backend with no file, env or explicit options."""
+    return BackendConfig(backend_name=backend_name)
+
+
+# Default configurations for backends that need them.
+# Read-only so they can be handed out without copying.
+BACKEND_DEFAULTS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "docling": MappingProxyType(
+            {
+                "do_ocr": False,  # Disabled by default for performance
+                "do_table_structure": True,
+                "num_threads": 4,
+                "device": "auto",
+                "ocr_languages": ["en"],
+            }
+        ),
+        "marker": MappingProxyType(
+            {
+                "use_llm": False,
+                "batch_size": 4,
+            }
+        ),
+        "unstructured": MappingProxyType(
+            {
+                "strategy": "fast",
+                "include_page_breaks": True,
+            }
+        ),
+    }
+)
+
+
+def get_backend_defaults(backend_name: str) -> Mapping[str, Any]:
+    """Get the read-only default configuration for a backend.
+
+    Use get_backend_defaults_mut() for a dict you can modify.
+    """
+    return BACKEND_DEFAULTS.get(backend_name, _EMPTY_MAPPING)
+
+
+def get_backend_defaults_mut(backend_name: str) -> dict[str, Any]:
+    """Get a modifiable copy of the default configuration for a backend."""
+    return dict(get_backend_defaults(backend_name))
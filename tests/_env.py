@@ -0,0 +1,21 @@
+"""Fake credentials for constructing commercial backends in mocked tests."""
+
+# The minimum environment each backend needs to construct its client
+AZURE_ENV = {
+    "AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT": "https://test.cognitiveservices.azure.com/",
+    "AZURE_DOCUMENT_INTELLIGENCE_KEY": "test-key",
+}
+
+GOOGLE_ENV = {
+    "GOOGLE_APPLICATION_CREDENTIALS": "/tmp/fake-creds.json",
+    "GOOGLE_CLOUD_PROJECT": "test-project",
+    "GOOGLE_DOCUMENT_AI_PROCESSOR_ID": "test-processor",
+}
+
+# The full set of Databricks credentials, including a fixed warehouse
+DATABRICKS_ENV = {
+    "DATABRICKS_HOST": "https://test.cloud.databricks.com",
+    "DATABRICKS_CLIENT_ID": "test-client-id",
+    "DATABRICKS_CLIENT_SECRET": "test-secret",
+    "DATABRICKS_WAREHOUSE_ID": "test-warehouse",
+}
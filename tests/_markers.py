@@ -0,0 +1,38 @@
+"""Skip marks for tests that need optional backends installed.
+
+Dependencies are checked with find_spec, so importing this module doesn't
+import any backend SDK; only tests that actually run pay for those imports.
+"""
+
+from importlib.util import find_spec
+
+import pytest
+
+from pdfsmith import available_backends
+
+
+def requires(module: str, package: str | None = None):
+    """Skip a test or class unless an optional dependency is installed."""
+    return pytest.mark.skipif(
+        find_spec(module) is None, reason=f"{package or module} not installed"
+    )
+
+
+# Probed once per test process; tests that need a backend name use this too
+INSTALLED_BACKENDS = available_backends()
+
+requires_backend = pytest.mark.skipif(
+    not INSTALLED_BACKENDS, reason="No backends installed"
+)
+requires_pypdf = requires("pypdf")
+requires_pdfplumber = requires("pdfplumber")
+requires_pymupdf = requires("fitz", "pymupdf")
+requires_aws = requires("boto3")
+requires_azure = requires(
+    "azure.ai.documentintelligence", "azure-ai-documentintelligence"
+)
+requires_google_docai = requires(
+    "google.cloud.documentai_v1", "google-cloud-documentai"
+)
+requires_databricks = requires("databricks.sdk", "databricks-sdk")
+requires_llamaparse = requires("llama_parse", "llama-parse")
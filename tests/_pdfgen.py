@@ -0,0 +1,75 @@
+"""Minimal PDF writer for test fixtures.
+
+Emits small, valid PDFs directly as bytes so tests don't need reportlab.
+Each page is US Letter with lines of Helvetica text, laid out the same way
+the reportlab fixtures used to draw them (x=100, starting at y=750, 50pt apart).
+"""
+
+_PAGE_WIDTH = 612
+_PAGE_HEIGHT = 792
+
+
+def _escape(text: str) -> bytes:
+    """Escape a string for use inside a PDF literal string."""
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return escaped.encode("latin-1")
+
+
+def _content_stream(lines: list[str]) -> bytes:
+    ops = []
+    for i, line in enumerate(lines):
+        y = 750 - 50 * i
+        ops.append(b"BT /F1 12 Tf 100 %d Td (%s) Tj ET" % (y, _escape(line)))
+    return b"\n".join(ops)
+
+
+def minimal_pdf(*lines: str, pages: int = 1) -> bytes:
+    """Build a PDF with the given text lines drawn on every page.
+
+    Lines may contain ``{page}`` and ``{pages}`` placeholders, which are
+    filled in with the 1-based page number and the total page count.
+
+    Example:
+        minimal_pdf("Page {page} of {pages}", pages=3)
+    """
+    # Object numbers: 1 catalog, 2 page tree, 3 font, then (page, content) pairs
+    objects: list[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # Page tree, filled in once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_refs = []
+    for page in range(1, pages + 1):
+        page_num = len(objects) + 1
+        content_num = page_num + 1
+        page_refs.append(b"%d 0 R" % page_num)
+        page_lines = [line.format(page=page, pages=pages) for line in lines]
+        stream = _content_stream(page_lines)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % (_PAGE_WIDTH, _PAGE_HEIGHT, content_num)
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(page_refs),
+        pages,
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref_offset,
+    )
+    return bytes(out)
@@ -1,100 +1,106 @@
 """Shared test fixtures and configuration for pdfsmith tests."""
 
 import os
-from contextlib import contextmanager
+import shutil
 from pathlib import Path
-from typing import Generator
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-@pytest.fixture
-def sample_pdf(tmp_path: Path) -> Path:
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed.
+
+        Async tests share one session-scoped loop (see
+        asyncio_default_test_loop_scope in pyproject.toml).
+        """
+        return {"uvloop": uvloop.new_event_loop}
+
+
+def _copy_fixture(name: str, dst: Path) -> Path:
+    """Copy a prebuilt PDF from tests/fixtures/ to dst."""
+    shutil.copyfile(FIXTURES_DIR / name, dst)
+    return dst
+
+
+@pytest.fixture(scope="session")
+def sample_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a minimal PDF for testing.
 
-    Creates a simple single-page PDF with test text using reportlab.
-    Skips the test if reportlab is not installed.
+    Copies a prebuilt single-page PDF with test text from tests/fixtures/,
+    once per session. Tests must treat it as read-only.
+    Regenerate fixtures with scripts/gen_fixtures.py.
     """
-    try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
-
-        pdf_path = tmp_path / "test.pdf"
-        c = canvas.Canvas(str(pdf_path), pagesize=letter)
-        c.drawString(100, 750, "Hello, pdfsmith!")
-        c.drawString(100, 700, "This is a test document.")
-        c.drawString(100, 650, "Page 1 of 1")
-        c.save()
-        return pdf_path
-    except ImportError:
-        pytest.skip("reportlab not installed, cannot create test PDF")
+    return _copy_fixture("minimal.pdf", tmp_path_factory.mktemp("sample") / "test.pdf")
 
 
-@pytest.fixture
-def multipage_pdf(tmp_path: Path) -> Path:
-    """Create a multi-page PDF for testing pagination handling."""
-    try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
-
-        pdf_path = tmp_path / "multipage.pdf"
-        c = canvas.Canvas(str(pdf_path), pagesize=letter)
-
-        for i in range(3):
-            c.drawString(100, 750, f"Page {i + 1} Header")
-            c.drawString(100, 700, f"Content for page {i + 1}")
-            c.drawString(100, 650, f"This is page {i + 1} of 3")
-            c.showPage()
-
-        c.save()
-        return pdf_path
-    except ImportError:
-        pytest.skip("reportlab not installed, cannot create test PDF")
+@pytest.fixture(scope="session")
+def stub_sample_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a bare PDF stub for tests that mock parsing.
+
+    Only the file's existence matters to these tests; use sample_pdf when
+    the content is actually parsed.
+    """
+    pdf_path = tmp_path_factory.mktemp("stub") / "stub.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%%EOF\n")
+    return pdf_path
+
+
+@pytest.fixture(scope="session")
+def multipage_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a 3-page PDF for testing pagination handling, once per session."""
+    return _copy_fixture(
+        "multipage.pdf", tmp_path_factory.mktemp("multipage") / "multipage.pdf"
+    )
+
+
+@pytest.fixture(scope="session")
+def manypage_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a 20-page PDF, past Google Document AI's 15-page sync limit."""
+    return _copy_fixture(
+        "manypage_20.pdf", tmp_path_factory.mktemp("manypage") / "manypage.pdf"
+    )
 
 
 @pytest.fixture
 def empty_pdf(tmp_path: Path) -> Path:
     """Create an empty PDF (no text content) for edge case testing."""
-    try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
-
-        pdf_path = tmp_path / "empty.pdf"
-        c = canvas.Canvas(str(pdf_path), pagesize=letter)
-        c.showPage()  # Empty page
-        c.save()
+    return _copy_fixture("empty.pdf", tmp_path / "empty.pdf")
+
+
+@pytest.fixture
+def make_sized_pdf(tmp_path: Path):
+    """Factory for files of a given nominal size in MB.
+
+    The files are sparse, so even multi-hundred-MB sizes cost no disk
+    blocks; only stat() sees the size. Use them for size-limit checks.
+    """
+
+    def _make(size_mb: int) -> Path:
+        pdf_path = tmp_path / f"{size_mb}mb.pdf"
+        pdf_path.touch()
+        os.truncate(pdf_path, size_mb * 1024 * 1024)
         return pdf_path
-    except ImportError:
-        pytest.skip("reportlab not installed, cannot create test PDF")
 
+    return _make
 
-@contextmanager
-def env_vars(**kwargs) -> Generator[None, None, None]:
-    """Context manager to temporarily set environment variables.
 
-    Restores original values (or removes if not present) on exit.
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    """Start every test with no cached config file lookups."""
+    from pdfsmith.config import clear_config_cache
 
-    Usage:
-        with env_vars(PDFSMITH_DOCLING_OCR="true"):
-            # test code here
-    """
-    original = {}
-    for key, value in kwargs.items():
-        original[key] = os.environ.get(key)
-        if value is None:
-            os.environ.pop(key, None)
-        else:
-            os.environ[key] = value
-
-    try:
-        yield
-    finally:
-        for key, orig_value in original.items():
-            if orig_value is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = orig_value
+    clear_config_cache()
 
 
 @pytest.fixture
@@ -116,18 +122,22 @@ def isolated_env(monkeypatch):
 
 
 @pytest.fixture
-def temp_config_dir(tmp_path: Path, monkeypatch) -> Path:
-    """Create a temporary config directory structure.
+def config_dirs(tmp_path: Path, monkeypatch) -> SimpleNamespace:
+    """Create empty local and user config directories under tmp_path.
 
-    Creates .pdfsmith/ directory and patches Path.home() to use tmp_path.
+    Changes into tmp_path and patches Path.home() to it, so
+    ``config_dirs.local`` is ./.pdfsmith/ and ``config_dirs.user`` is
+    ~/.config/pdfsmith/.
     """
-    config_dir = tmp_path / ".pdfsmith"
-    config_dir.mkdir()
-
-    # Patch home directory to use tmp_path
+    monkeypatch.chdir(tmp_path)
     monkeypatch.setattr(Path, "home", lambda: tmp_path)
 
-    return config_dir
+    local = tmp_path / ".pdfsmith"
+    local.mkdir()
+    user = tmp_path / ".config" / "pdfsmith"
+    user.mkdir(parents=True)
+
+    return SimpleNamespace(local=local, user=user)
 
 
 @pytest.fixture
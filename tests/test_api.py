@@ -1,19 +1,18 @@
 """Tests for the pdfsmith API."""
 
+import re
 from pathlib import Path
 
 import pytest
 
 from pdfsmith import __version__, available_backends, get_backend
 from pdfsmith.backends.registry import BACKEND_REGISTRY
+from tests._markers import INSTALLED_BACKENDS, requires_backend
 
 
 def test_version():
     """Version should be a valid semver string."""
-    assert __version__
-    parts = __version__.split(".")
-    assert len(parts) == 3
-    assert all(p.isdigit() for p in parts)
+    assert re.fullmatch(r"\d+\.\d+\.\d+", __version__)
 
 
 def test_backend_registry_not_empty():
@@ -57,65 +56,29 @@ def test_get_backend_not_installed():
 class TestWithBackend:
     """Tests that require at least one backend installed."""
 
-    @pytest.fixture
-    def sample_pdf(self, tmp_path: Path) -> Path:
-        """Create a minimal PDF for testing."""
-        # Create a simple PDF using reportlab if available, otherwise skip
-        try:
-            from reportlab.lib.pagesizes import letter
-            from reportlab.pdfgen import canvas
-
-            pdf_path = tmp_path / "test.pdf"
-            c = canvas.Canvas(str(pdf_path), pagesize=letter)
-            c.drawString(100, 750, "Hello, pdfsmith!")
-            c.drawString(100, 700, "This is a test document.")
-            c.save()
-            return pdf_path
-        except ImportError:
-            pytest.skip("reportlab not installed, cannot create test PDF")
-
+    @requires_backend
     def test_get_backend_auto_select(self):
         """get_backend with None should auto-select available backend."""
-        backends = available_backends()
-        if not backends:
-            pytest.skip("No backends installed")
-
         backend = get_backend(None)
         assert backend is not None
         assert hasattr(backend, "parse")
 
-    def test_parse_returns_string(self, sample_pdf: Path):
-        """parse should return a string."""
+    @requires_backend
+    def test_parse_returns_content(self, sample_pdf: Path):
+        """parse should return a string containing the text content."""
         from pdfsmith import parse
 
-        backends = available_backends()
-        if not backends:
-            pytest.skip("No backends installed")
-
         result = parse(sample_pdf)
         assert isinstance(result, str)
         assert len(result) > 0
-
-    def test_parse_contains_content(self, sample_pdf: Path):
-        """parse should extract text content."""
-        from pdfsmith import parse
-
-        backends = available_backends()
-        if not backends:
-            pytest.skip("No backends installed")
-
-        result = parse(sample_pdf)
         # Should contain at least part of our test text
         assert "pdfsmith" in result.lower() or "hello" in result.lower()
 
+    @requires_backend
     def test_parse_file_not_found(self):
         """parse should raise FileNotFoundError for missing files."""
         from pdfsmith import parse
 
-        backends = available_backends()
-        if not backends:
-            pytest.skip("No backends installed")
-
         with pytest.raises(FileNotFoundError):
             parse(Path("/nonexistent/file.pdf"))
 
@@ -123,13 +86,10 @@ class TestWithBackend:
 class TestBackendSelection:
     """Tests for backend selection and registry behavior."""
 
+    @requires_backend
     def test_get_backend_returns_singleton(self):
         """get_backend should return same instance for repeated calls."""
-        backends = available_backends()
-        if not backends:
-            pytest.skip("No backends installed")
-
-        backend_name = backends[0].name
+        backend_name = INSTALLED_BACKENDS[0].name
         instance1 = get_backend(backend_name)
         instance2 = get_backend(backend_name)
 
@@ -139,12 +99,11 @@ class TestBackendSelection:
         """Available backends should follow preference order."""
         from pdfsmith.api import DEFAULT_PREFERENCE
 
-        backends = available_backends()
-        if len(backends) < 2:
+        if len(INSTALLED_BACKENDS) < 2:
             pytest.skip("Need at least 2 backends to test order")
 
         # Get indices of available backends in preference list
-        backend_names = [b.name for b in backends]
+        backend_names = [b.name for b in INSTALLED_BACKENDS]
         indices = []
         for name in backend_names:
             if name in DEFAULT_PREFERENCE:
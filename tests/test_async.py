@@ -1,25 +1,13 @@
 """Tests for async PDF parsing functionality."""
 
 import asyncio
-import functools
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from pdfsmith import available_backends, parse_async
-
-
-def requires_backend(func):
-    """Skip test if no backends are installed."""
-
-    @functools.wraps(func)
-    async def wrapper(*args, **kwargs):
-        if not available_backends():
-            pytest.skip("No backends installed")
-        return await func(*args, **kwargs)
-
-    return wrapper
+from pdfsmith import parse_async
+from tests._markers import INSTALLED_BACKENDS, requires_backend
 
 
 @pytest.mark.asyncio
@@ -34,13 +22,10 @@ class TestAsyncParsing:
         assert isinstance(result, str)
         assert len(result) > 0
 
+    @requires_backend
     async def test_parse_async_with_backend(self, sample_pdf):
         """parse_async should accept backend parameter."""
-        backends = available_backends()
-        if not backends:
-            pytest.skip("No backends installed")
-
-        backend_name = backends[0].name
+        backend_name = INSTALLED_BACKENDS[0].name
         result = await parse_async(sample_pdf, backend=backend_name)
 
         assert isinstance(result, str)
@@ -0,0 +1,209 @@
+"""Tests for the AWS Textract backend.
+
+Textract calls go through a real boto3 client wrapped in a botocore Stubber,
+so no AWS credentials or network access are needed.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from pdfsmith.backends.aws_textract_backend import AWSTextractBackend
+from tests._markers import requires_aws
+from tests._pdfgen import minimal_pdf
+
+
+@pytest.fixture(scope="module")
+def textract_stub():
+    """One real Textract client wrapped in a botocore Stubber.
+
+    boto3.client is patched to hand the cached client to every backend built
+    in this module, so tests queue responses on the stubber instead of
+    constructing a fresh client (and Mock) each time.
+    """
+    import boto3
+    from botocore.stub import Stubber
+
+    client = boto3.client(
+        "textract",
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+    )
+    with pytest.MonkeyPatch.context() as mp, Stubber(client) as stub:
+        mp.delenv("AWS_PROFILE", raising=False)
+        mp.setattr(boto3, "client", lambda *args, **kwargs: client)
+        yield stub
+
+
+@pytest.fixture(scope="module")
+def aws_session(tmp_path_factory):
+    """A real boto3 Session for a dummy "test-profile", shared by the module.
+
+    The profile lives in a throwaway AWS config file, so the session (and
+    clients built from it) resolve it without touching ~/.aws.
+    """
+    import boto3
+
+    config = tmp_path_factory.mktemp("aws") / "config"
+    config.write_text(
+        "[profile test-profile]\n"
+        "region = us-east-1\n"
+        "aws_access_key_id = testing\n"
+        "aws_secret_access_key = testing\n"
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AWS_CONFIG_FILE", str(config))
+        yield boto3.Session(profile_name="test-profile", region_name="us-east-1")
+
+
+@pytest.fixture
+def textract(textract_stub):
+    """The module's Textract stubber, checked for unconsumed responses."""
+    yield textract_stub
+    textract_stub.assert_no_pending_responses()
+
+
+@pytest.fixture(scope="class")
+def aws_backend(textract_stub) -> AWSTextractBackend:
+    """One backend per test class, bound to the stubbed Textract client.
+
+    parse() and _extract_blocks() keep no state on the instance, so tests
+    that only exercise them can share it.
+    """
+    return AWSTextractBackend()
+
+
+@pytest.fixture(scope="session", params=[1, 3, 10], ids=lambda n: f"{n}-page")
+def paged_pdf(request, tmp_path_factory) -> tuple[Path, int]:
+    """A PDF with the parametrized page count, built once per count."""
+    pages = request.param
+    pdf_path = tmp_path_factory.mktemp("paged") / f"{pages}page.pdf"
+    pdf_path.write_bytes(minimal_pdf("Page {page} of {pages}", pages=pages))
+    return pdf_path, pages
+
+
+@requires_aws
+class TestAWSTextractBackend:
+    """Tests for AWS Textract backend."""
+
+    def test_initialization_requires_credentials(self, textract, monkeypatch):
+        """Backend should fail without AWS credentials."""
+        # Clear AWS env vars
+        for key in (
+            "AWS_PROFILE",
+            "AWS_ACCESS_KEY_ID",
+            "AWS_SECRET_ACCESS_KEY",
+            "AWS_SESSION_TOKEN",
+            "AWS_DEFAULT_REGION",
+        ):
+            monkeypatch.delenv(key, raising=False)
+
+        backend = AWSTextractBackend()
+        assert backend.client is textract.client
+
+    def test_initialization_with_profile(self, aws_session, monkeypatch):
+        """Backend should initialize with AWS_PROFILE."""
+        import boto3
+
+        monkeypatch.setenv("AWS_PROFILE", "test-profile")
+        monkeypatch.delenv("AWS_REGION", raising=False)
+        expected = {"profile_name": "test-profile", "region_name": "us-east-1"}
+
+        def session(**kwargs):
+            if kwargs != expected:
+                pytest.fail(f"unexpected boto3.Session kwargs {kwargs}")
+            return aws_session
+
+        monkeypatch.setattr(boto3, "Session", session)
+
+        backend = AWSTextractBackend()
+        assert backend.client.meta.service_model.service_name == "textract"
+        assert backend.client.meta.region_name == "us-east-1"
+
+    def test_parse_single_page(self, aws_backend, textract, sample_pdf: Path):
+        """Backend should parse single-page PDF."""
+        textract.add_response(
+            "detect_document_text",
+            {
+                "Blocks": [
+                    {
+                        "BlockType": "LINE",
+                        "Text": "Test Document Title",
+                        "Confidence": 99.5,
+                    },
+                    {
+                        "BlockType": "LINE",
+                        "Text": "This is paragraph one with some text content.",
+                        "Confidence": 99.5,
+                    },
+                ]
+            },
+            {"Document": {"Bytes": sample_pdf.read_bytes()}},
+        )
+
+        result = aws_backend.parse(sample_pdf)
+
+        assert isinstance(result, str)
+        assert "Test Document Title" in result
+
+    def test_parse_multipage_pdf(
+        self, aws_backend, textract, paged_pdf: tuple[Path, int]
+    ):
+        """Backend should make one API call per page and keep page order."""
+        pdf_path, pages = paged_pdf
+        # The textract fixture fails the test if any response goes unconsumed
+        for page in range(1, pages + 1):
+            textract.add_response(
+                "detect_document_text",
+                {"Blocks": [{"BlockType": "LINE", "Text": f"Page {page}"}]},
+            )
+
+        result = aws_backend.parse(pdf_path)
+
+        assert result == "\n\n".join(f"Page {page}" for page in range(1, pages + 1))
+
+    @pytest.mark.parametrize(
+        "code,message,exc,match",
+        [
+            ("ThrottlingException", "Rate exceeded", RuntimeError, "rate limit"),
+            ("InvalidParameterException", "Invalid PDF", ValueError, "Invalid PDF"),
+        ],
+        ids=["throttling", "invalid-parameter"],
+    )
+    def test_parse_client_error_mapping(
+        self, aws_backend, textract, sample_pdf: Path, code, message, exc, match
+    ):
+        """Backend should map Textract error codes to pdfsmith exceptions."""
+        textract.add_client_error(
+            "detect_document_text",
+            service_error_code=code,
+            service_message=message,
+        )
+
+        with pytest.raises(exc, match=match):
+            aws_backend.parse(sample_pdf)
+
+    @pytest.mark.parametrize(
+        "response,expected",
+        [
+            (
+                {
+                    "Blocks": [
+                        {"BlockType": "PAGE", "Text": "Page 1"},
+                        {"BlockType": "LINE", "Text": "Line 1"},
+                        {"BlockType": "WORD", "Text": "Word"},
+                        {"BlockType": "LINE", "Text": "Line 2"},
+                        {"BlockType": "LINE", "Text": ""},  # Empty line
+                    ]
+                },
+                ["Line 1", "Line 2"],
+            ),
+            ({"Blocks": []}, []),
+            ({}, []),
+        ],
+        ids=["filters-non-line", "no-blocks", "empty-response"],
+    )
+    def test_extract_blocks(self, aws_backend, response, expected):
+        """_extract_blocks should keep only non-empty LINE block text."""
+        assert aws_backend._extract_blocks(response) == expected
@@ -0,0 +1,133 @@
+"""Tests for the Azure Document Intelligence backend.
+
+These tests use mocking to avoid requiring real API credentials.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pdfsmith.backends.azure_document_intelligence_backend import (
+    AzureDocumentIntelligenceBackend,
+)
+from tests._env import AZURE_ENV
+from tests._markers import requires_azure
+
+
+@dataclass(frozen=True)
+class FakeAzureLine:
+    content: str
+
+
+@dataclass(frozen=True)
+class FakeAzurePage:
+    lines: tuple[FakeAzureLine, ...] | None = None
+
+
+@dataclass(frozen=True)
+class FakeAzureResult:
+    pages: tuple[FakeAzurePage, ...] | None = None
+
+
+@pytest.fixture(scope="session")
+def fake_azure_result() -> FakeAzureResult:
+    """A one-page AnalyzeResult stand-in with two lines of text."""
+    return FakeAzureResult(
+        pages=(
+            FakeAzurePage(
+                lines=(
+                    FakeAzureLine("Test Document Title"),
+                    FakeAzureLine("This is paragraph one with some text content."),
+                )
+            ),
+        )
+    )
+
+
+@requires_azure
+class TestAzureDocumentIntelligenceBackend:
+    """Tests for Azure Document Intelligence backend."""
+
+    @pytest.fixture
+    def azure_env(self, monkeypatch):
+        """Set the Azure credentials from AZURE_ENV for a test."""
+        for key, value in AZURE_ENV.items():
+            monkeypatch.setenv(key, value)
+
+    @pytest.mark.parametrize("missing", list(AZURE_ENV))
+    def test_initialization_missing_env(self, monkeypatch, missing):
+        """Backend should fail when either credential env var is unset."""
+        for key, value in AZURE_ENV.items():
+            monkeypatch.setenv(key, value)
+        monkeypatch.delenv(missing)
+
+        with pytest.raises(RuntimeError, match=missing):
+            AzureDocumentIntelligenceBackend()
+
+    def test_parse_with_mocked_client(
+        self, sample_pdf: Path, fake_azure_result: FakeAzureResult, azure_env
+    ):
+        """Backend should parse PDF with mocked Azure client."""
+        # Mock Azure client
+        with patch(
+            "pdfsmith.backends.azure_document_intelligence_backend.DocumentIntelligenceClient"
+        ) as mock_client_class:
+            mock_client = Mock()
+            mock_client.begin_analyze_document.return_value.result.return_value = (
+                fake_azure_result
+            )
+            mock_client_class.return_value = mock_client
+
+            backend = AzureDocumentIntelligenceBackend()
+            result = backend.parse(sample_pdf)
+
+            assert result == (
+                "Test Document Title\n\nThis is paragraph one with some text content."
+            )
+
+    @pytest.mark.parametrize(
+        "status,message,exc,match",
+        [
+            (429, "Rate limit exceeded", RuntimeError, "rate limit"),
+            (400, "Invalid document format", ValueError, "Invalid PDF"),
+        ],
+        ids=["rate-limit", "invalid-pdf"],
+    )
+    def test_parse_http_error_mapping(
+        self, sample_pdf: Path, azure_env, status, message, exc, match
+    ):
+        """Backend should map HTTP error statuses to pdfsmith exceptions."""
+        from azure.core.exceptions import HttpResponseError
+
+        with patch(
+            "pdfsmith.backends.azure_document_intelligence_backend.DocumentIntelligenceClient"
+        ) as mock_client_class:
+            mock_client = Mock()
+            error = HttpResponseError(message=message)
+            error.status_code = status
+            mock_client.begin_analyze_document.side_effect = error
+            mock_client_class.return_value = mock_client
+
+            backend = AzureDocumentIntelligenceBackend()
+
+            with pytest.raises(exc, match=match):
+                backend.parse(sample_pdf)
+
+    def test_extract_text_empty_pages(self, azure_env):
+        """_extract_text should handle empty pages."""
+        with patch(
+            "pdfsmith.backends.azure_document_intelligence_backend.DocumentIntelligenceClient"
+        ):
+            backend = AzureDocumentIntelligenceBackend()
+
+            # Test with None pages
+            assert backend._extract_text(FakeAzureResult(pages=None)) == ""
+
+            # Test with empty pages list
+            assert backend._extract_text(FakeAzureResult(pages=())) == ""
+
+            # Test with pages but no lines
+            result = FakeAzureResult(pages=(FakeAzurePage(lines=None),))
+            assert backend._extract_text(result) == ""
@@ -1,51 +1,62 @@
 """Tests for the pdfsmith CLI."""
 
+import argparse
+import contextlib
+import io
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
-from pdfsmith.cli import cmd_backends, cmd_parse, main
+from pdfsmith import __version__
+from pdfsmith.cli import _build_parser, cmd_backends, cmd_parse, main
+
+
+def _parse_args(
+    pdf_file: Path, output: Path | None = None, backend: str | None = None
+) -> argparse.Namespace:
+    """Build the namespace main() would pass to cmd_parse."""
+    return argparse.Namespace(pdf_file=pdf_file, output=output, backend=backend)
 
 
 class TestMain:
     """Tests for the main() entry point."""
 
-    def test_no_args_shows_help(self, capsys):
+    def test_no_args_shows_help(self, capsys, monkeypatch):
         """Running with no args should show help and return 0."""
-        with patch.object(sys, "argv", ["pdfsmith"]):
-            result = main()
+        monkeypatch.setattr(sys, "argv", ["pdfsmith"])
+        result = main()
 
         assert result == 0
         captured = capsys.readouterr()
         assert "Convert PDF files to Markdown" in captured.out
         assert "Commands" in captured.out
 
-    def test_version_flag(self, capsys):
+    def test_version_flag(self):
         """--version should print version and exit."""
-        with patch.object(sys, "argv", ["pdfsmith", "--version"]):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
+        buf = io.StringIO()
+        with contextlib.suppress(SystemExit), contextlib.redirect_stdout(buf):
+            _build_parser().parse_args(["--version"])
 
-        assert exc_info.value.code == 0
-        captured = capsys.readouterr()
-        assert "pdfsmith" in captured.out
+        assert buf.getvalue().strip() == f"pdfsmith {__version__}"
 
-    def test_parse_command_routes_correctly(self, sample_pdf):
+    def test_parse_command_routes_correctly(self, stub_sample_pdf, monkeypatch):
         """parse command should route to cmd_parse."""
-        with patch.object(sys, "argv", ["pdfsmith", "parse", str(sample_pdf)]):
-            with patch("pdfsmith.cli.cmd_parse", return_value=0) as mock_cmd:
-                result = main()
+        mock_cmd = MagicMock(return_value=0)
+        monkeypatch.setattr(sys, "argv", ["pdfsmith", "parse", str(stub_sample_pdf)])
+        monkeypatch.setattr("pdfsmith.cli.cmd_parse", mock_cmd)
+        result = main()
 
         assert result == 0
         mock_cmd.assert_called_once()
 
-    def test_backends_command_routes_correctly(self):
+    def test_backends_command_routes_correctly(self, monkeypatch):
         """backends command should route to cmd_backends."""
-        with patch.object(sys, "argv", ["pdfsmith", "backends"]):
-            with patch("pdfsmith.cli.cmd_backends", return_value=0) as mock_cmd:
-                result = main()
+        mock_cmd = MagicMock(return_value=0)
+        monkeypatch.setattr(sys, "argv", ["pdfsmith", "backends"])
+        monkeypatch.setattr("pdfsmith.cli.cmd_backends", mock_cmd)
+        result = main()
 
         assert result == 0
         mock_cmd.assert_called_once()
@@ -54,36 +65,34 @@ class TestMain:
 class TestParseCommand:
     """Tests for the parse command."""
 
-    def test_parse_to_stdout(self, sample_pdf, capsys):
+    def test_parse_to_stdout(self, stub_sample_pdf, capsys, monkeypatch):
         """Parse without -o should print to stdout."""
         mock_markdown = "# Test Document\n\nHello, pdfsmith!"
+        monkeypatch.setattr("pdfsmith.cli.parse", lambda *a, **kw: mock_markdown)
 
-        with patch("pdfsmith.cli.parse", return_value=mock_markdown):
-            with patch.object(
-                sys, "argv", ["pdfsmith", "parse", str(sample_pdf)]
-            ):
-                result = main()
+        result = cmd_parse(_parse_args(stub_sample_pdf))
 
         assert result == 0
         captured = capsys.readouterr()
         assert mock_markdown in captured.out
 
-    def test_parse_to_file(self, sample_pdf, tmp_path, capsys):
+    def test_parse_to_file(self, stub_sample_pdf, tmp_path, capsys, monkeypatch):
         """Parse with -o should write to file."""
         mock_markdown = "# Test Document\n\nHello, pdfsmith!"
         output_file = tmp_path / "output.md"
+        monkeypatch.setattr("pdfsmith.cli.parse", lambda *a, **kw: mock_markdown)
+
+        written = {}
+
+        def fake_write_text(self, data, encoding=None):
+            written[self] = (data, encoding)
+
+        monkeypatch.setattr(Path, "write_text", fake_write_text)
 
-        with patch("pdfsmith.cli.parse", return_value=mock_markdown):
-            with patch.object(
-                sys,
-                "argv",
-                ["pdfsmith", "parse", str(sample_pdf), "-o", str(output_file)],
-            ):
-                result = main()
+        result = cmd_parse(_parse_args(stub_sample_pdf, output=output_file))
 
         assert result == 0
-        assert output_file.exists()
-        assert output_file.read_text() == mock_markdown
+        assert written == {output_file: (mock_markdown, "utf-8")}
         captured = capsys.readouterr()
         assert f"Written to {output_file}" in captured.out
 
@@ -91,56 +100,46 @@ class TestParseCommand:
         """Parse with non-existent file should error."""
         nonexistent = tmp_path / "nonexistent.pdf"
 
-        with patch.object(
-            sys, "argv", ["pdfsmith", "parse", str(nonexistent)]
-        ):
-            result = main()
+        result = cmd_parse(_parse_args(nonexistent))
 
         assert result == 1
         captured = capsys.readouterr()
         assert "Error: File not found" in captured.err
 
-    def test_parse_with_backend(self, sample_pdf):
+    def test_parse_with_backend(self, stub_sample_pdf, monkeypatch):
         """Parse with -b should pass backend to parse()."""
-        with patch("pdfsmith.cli.parse", return_value="# Test") as mock_parse:
-            with patch.object(
-                sys,
-                "argv",
-                ["pdfsmith", "parse", str(sample_pdf), "-b", "pypdf"],
-            ):
-                result = main()
+        mock_parse = MagicMock(return_value="# Test")
+        monkeypatch.setattr("pdfsmith.cli.parse", mock_parse)
+
+        result = cmd_parse(_parse_args(stub_sample_pdf, backend="pypdf"))
 
         assert result == 0
         mock_parse.assert_called_once()
         call_kwargs = mock_parse.call_args[1]
         assert call_kwargs["backend"] == "pypdf"
 
-    def test_parse_import_error(self, sample_pdf, capsys):
+    def test_parse_import_error(self, stub_sample_pdf, capsys, monkeypatch):
         """ImportError during parse should be handled gracefully."""
-        with patch(
+        monkeypatch.setattr(
             "pdfsmith.cli.parse",
-            side_effect=ImportError("Backend 'marker' not installed"),
-        ):
-            with patch.object(
-                sys, "argv", ["pdfsmith", "parse", str(sample_pdf)]
-            ):
-                result = main()
+            MagicMock(side_effect=ImportError("Backend 'marker' not installed")),
+        )
+
+        result = cmd_parse(_parse_args(stub_sample_pdf))
 
         assert result == 1
         captured = capsys.readouterr()
         assert "Error:" in captured.err
         assert "not installed" in captured.err
 
-    def test_parse_generic_error(self, sample_pdf, capsys):
+    def test_parse_generic_error(self, stub_sample_pdf, capsys, monkeypatch):
         """Generic exception during parse should be handled gracefully."""
-        with patch(
+        monkeypatch.setattr(
             "pdfsmith.cli.parse",
-            side_effect=Exception("PDF is corrupted"),
-        ):
-            with patch.object(
-                sys, "argv", ["pdfsmith", "parse", str(sample_pdf)]
-            ):
-                result = main()
+            MagicMock(side_effect=Exception("PDF is corrupted")),
+        )
+
+        result = cmd_parse(_parse_args(stub_sample_pdf))
 
         assert result == 1
         captured = capsys.readouterr()
@@ -151,29 +150,41 @@ class TestParseCommand:
 class TestBackendsCommand:
     """Tests for the backends command."""
 
-    def test_backends_lists_available(self, capsys):
-        """backends command should list installed backends."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def backend_infos(cls):
+        """Registry entries spanning each weight class, built once per class."""
         from pdfsmith.backends.registry import BackendInfo
 
-        mock_backends = [
+        return [
             BackendInfo(
                 name="pypdf",
                 description="Pure Python PDF library",
                 package="pypdf",
                 weight="light",
-                loader=lambda: MagicMock,
+                loader=lambda: None,
+            ),
+            BackendInfo(
+                name="test_backend",
+                description="Test description",
+                package="test-package",
+                weight="medium",
+                loader=lambda: None,
             ),
             BackendInfo(
                 name="docling",
                 description="IBM document understanding",
                 package="docling",
                 weight="heavy",
-                loader=lambda: MagicMock,
+                loader=lambda: None,
             ),
         ]
 
-        with patch("pdfsmith.cli.available_backends", return_value=mock_backends):
-            result = cmd_backends()
+    def test_backends_lists_available(self, backend_infos, capsys, monkeypatch):
+        """backends command should list installed backends."""
+        monkeypatch.setattr("pdfsmith.cli.available_backends", lambda: backend_infos)
+
+        result = cmd_backends()
 
         assert result == 0
         captured = capsys.readouterr()
@@ -183,10 +194,11 @@ class TestBackendsCommand:
         assert "[heavy]" in captured.out
         assert "Pure Python PDF library" in captured.out
 
-    def test_backends_none_installed(self, capsys):
+    def test_backends_none_installed(self, capsys, monkeypatch):
         """backends with no backends should show installation help."""
-        with patch("pdfsmith.cli.available_backends", return_value=[]):
-            result = cmd_backends()
+        monkeypatch.setattr("pdfsmith.cli.available_backends", lambda: [])
+
+        result = cmd_backends()
 
         assert result == 0
         captured = capsys.readouterr()
@@ -195,20 +207,11 @@ class TestBackendsCommand:
         assert "pip install pdfsmith[recommended]" in captured.out
         assert "pip install pdfsmith[all]" in captured.out
 
-    def test_backends_output_format(self, capsys):
+    def test_backends_output_format(self, backend_infos, capsys, monkeypatch):
         """backends output should be properly formatted."""
-        from pdfsmith.backends.registry import BackendInfo
+        monkeypatch.setattr("pdfsmith.cli.available_backends", lambda: backend_infos)
 
-        mock_backend = BackendInfo(
-            name="test_backend",
-            description="Test description",
-            package="test-package",
-            weight="medium",
-            loader=lambda: MagicMock,
-        )
-
-        with patch("pdfsmith.cli.available_backends", return_value=[mock_backend]):
-            result = cmd_backends()
+        result = cmd_backends()
 
         assert result == 0
         captured = capsys.readouterr()
@@ -221,25 +224,22 @@ class TestBackendsCommand:
 class TestCmdParseDirect:
     """Direct tests for cmd_parse function."""
 
-    def test_cmd_parse_returns_zero_on_success(self, sample_pdf):
+    def test_cmd_parse_returns_zero_on_success(self, stub_sample_pdf, monkeypatch):
         """cmd_parse should return 0 on success."""
-        import argparse
-
         args = argparse.Namespace(
-            pdf_file=sample_pdf,
+            pdf_file=stub_sample_pdf,
             output=None,
             backend=None,
         )
 
-        with patch("pdfsmith.cli.parse", return_value="# Test"):
-            result = cmd_parse(args)
+        monkeypatch.setattr("pdfsmith.cli.parse", lambda *a, **kw: "# Test")
+
+        result = cmd_parse(args)
 
         assert result == 0
 
     def test_cmd_parse_returns_one_on_file_not_found(self, tmp_path):
         """cmd_parse should return 1 when file doesn't exist."""
-        import argparse
-
         args = argparse.Namespace(
             pdf_file=tmp_path / "nonexistent.pdf",
             output=None,
@@ -1,1691 +1,479 @@
 """Tests for commercial backends.
 
 These tests use mocking to avoid requiring real API credentials.
+Checks shared by the AWS, Azure and Google backends live here; each of those
+backends also has its own test module (test_<backend>_backend.py).
 For integration testing with real APIs, see tests/integration/test_commercial_integration.py
 """
 
-import pytest
+from dataclasses import dataclass, field
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-import os
-
-
-@pytest.fixture
-def sample_pdf(tmp_path: Path) -> Path:
-    """Create a minimal PDF for testing."""
-    try:
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.pagesizes import letter
-
-        pdf_path = tmp_path / "test.pdf"
-        c = canvas.Canvas(str(pdf_path), pagesize=letter)
-        c.drawString(100, 750, "Test Document Title")
-        c.drawString(100, 700, "This is paragraph one with some text content.")
-        c.drawString(100, 650, "This is paragraph two with more content.")
-        c.save()
-        return pdf_path
-    except ImportError:
-        pytest.skip("reportlab not installed")
-
-
-@pytest.fixture
-def env_vars():
-    """Store and restore environment variables."""
-    original_env = os.environ.copy()
-    yield
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
-
-
-class TestAWSTextractBackend:
-    """Tests for AWS Textract backend."""
-
-    def test_import(self):
-        """Backend should be importable."""
-        try:
-            from pdfsmith.backends.aws_textract_backend import (
-                AWSTextractBackend,
-                AVAILABLE,
-            )
-
-            assert AWSTextractBackend is not None
-        except ImportError:
-            pytest.skip("boto3 not installed")
-
-    def test_initialization_requires_credentials(self, env_vars):
-        """Backend should fail without AWS credentials."""
-        try:
-            from pdfsmith.backends.aws_textract_backend import (
-                AWSTextractBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("boto3 not installed")
-
-            # Clear AWS env vars
-            for key in list(os.environ.keys()):
-                if key.startswith("AWS_"):
-                    del os.environ[key]
-
-            # Mock boto3 client creation
-            with patch("pdfsmith.backends.aws_textract_backend.boto3.client") as mock_client:
-                mock_client.return_value = Mock()
-                backend = AWSTextractBackend()
-                assert backend.client is not None
-
-        except ImportError:
-            pytest.skip("boto3 not installed")
-
-    def test_initialization_with_profile(self, env_vars):
-        """Backend should initialize with AWS_PROFILE."""
-        try:
-            from pdfsmith.backends.aws_textract_backend import (
-                AWSTextractBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("boto3 not installed")
-
-            os.environ["AWS_PROFILE"] = "test-profile"
-
-            with patch("boto3.Session") as mock_session:
-                mock_session_instance = Mock()
-                mock_session_instance.client.return_value = Mock()
-                mock_session.return_value = mock_session_instance
-
-                backend = AWSTextractBackend()
-                assert backend.client is not None
-                mock_session.assert_called_once_with(
-                    profile_name="test-profile", region_name="us-east-1"
-                )
-
-        except ImportError:
-            pytest.skip("boto3 not installed")
-
-    def test_parse_single_page(self, sample_pdf: Path):
-        """Backend should parse single-page PDF."""
-        try:
-            from pdfsmith.backends.aws_textract_backend import (
-                AWSTextractBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("boto3 not installed")
-
-            # Create backend first, then replace the client with mock
-            with patch("pdfsmith.backends.aws_textract_backend.boto3") as mock_boto3:
-                mock_client = Mock()
-                mock_client.detect_document_text.return_value = {
-                    "Blocks": [
-                        {
-                            "BlockType": "LINE",
-                            "Text": "Test Document Title",
-                            "Confidence": 99.5,
-                        },
-                        {
-                            "BlockType": "LINE",
-                            "Text": "This is paragraph one with some text content.",
-                            "Confidence": 99.5,
-                        },
-                    ]
-                }
-                mock_boto3.client.return_value = mock_client
-                mock_boto3.Session.return_value.client.return_value = mock_client
-
-                backend = AWSTextractBackend()
-                result = backend.parse(sample_pdf)
-
-                assert isinstance(result, str)
-                assert "Test Document Title" in result
-                assert mock_client.detect_document_text.called
-
-        except ImportError:
-            pytest.skip("boto3 not installed")
-
-    def test_parse_file_not_found(self, tmp_path: Path):
-        """Backend should raise FileNotFoundError for missing file."""
-        try:
-            from pdfsmith.backends.aws_textract_backend import (
-                AWSTextractBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("boto3 not installed")
-
-            with patch("pdfsmith.backends.aws_textract_backend.boto3") as mock_boto3:
-                mock_boto3.client.return_value = Mock()
-                mock_boto3.Session.return_value.client.return_value = Mock()
-                backend = AWSTextractBackend()
-
-                with pytest.raises(FileNotFoundError):
-                    backend.parse(tmp_path / "nonexistent.pdf")
-
-        except ImportError:
-            pytest.skip("boto3 not installed")
-
-    def test_parse_file_too_large(self, tmp_path: Path):
-        """Backend should raise ValueError for files over 10 MB."""
-        try:
-            from pdfsmith.backends.aws_textract_backend import (
-                AWSTextractBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("boto3 not installed")
-
-            # Create a large file (mock by creating small file and mocking stat)
-            large_pdf = tmp_path / "large.pdf"
-            large_pdf.write_bytes(b"fake pdf content")
-
-            with patch("pdfsmith.backends.aws_textract_backend.boto3") as mock_boto3:
-                mock_boto3.client.return_value = Mock()
-                mock_boto3.Session.return_value.client.return_value = Mock()
-                backend = AWSTextractBackend()
-
-                # Mock file size to appear as 15 MB
-                with patch.object(Path, "stat") as mock_stat:
-                    mock_stat.return_value = Mock(st_size=15 * 1024 * 1024)
-
-                    with pytest.raises(ValueError, match="10 MB limit"):
-                        backend.parse(large_pdf)
-
-        except ImportError:
-            pytest.skip("boto3 not installed")
-
-    def test_parse_multipage_pdf(self, tmp_path: Path):
-        """Backend should handle multi-page PDFs."""
-        try:
-            from pdfsmith.backends.aws_textract_backend import (
-                AWSTextractBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("boto3 not installed")
-
-            # Create multi-page PDF
-            try:
-                from reportlab.pdfgen import canvas
-                from reportlab.lib.pagesizes import letter
-
-                pdf_path = tmp_path / "multipage.pdf"
-                c = canvas.Canvas(str(pdf_path), pagesize=letter)
-                for i in range(3):
-                    c.drawString(100, 750, f"Page {i + 1}")
-                    c.showPage()
-                c.save()
-            except ImportError:
-                pytest.skip("reportlab not installed")
-
-            with patch("pdfsmith.backends.aws_textract_backend.boto3") as mock_boto3:
-                mock_client = Mock()
-                mock_client.detect_document_text.return_value = {
-                    "Blocks": [
-                        {"BlockType": "LINE", "Text": "Page content"},
-                    ]
-                }
-                mock_boto3.client.return_value = mock_client
-                mock_boto3.Session.return_value.client.return_value = mock_client
-
-                backend = AWSTextractBackend()
-                result = backend.parse(pdf_path)
-
-                assert isinstance(result, str)
-                # Should call API multiple times for multi-page
-                assert mock_client.detect_document_text.call_count == 3
-
-        except ImportError:
-            pytest.skip("boto3 not installed")
-
-    def test_parse_throttling_error(self, sample_pdf: Path):
-        """Backend should handle throttling errors."""
-        try:
-            from pdfsmith.backends.aws_textract_backend import (
-                AWSTextractBackend,
-                AVAILABLE,
-            )
-            from botocore.exceptions import ClientError
-
-            if not AVAILABLE:
-                pytest.skip("boto3 not installed")
-
-            with patch("pdfsmith.backends.aws_textract_backend.boto3") as mock_boto3:
-                mock_client = Mock()
-                mock_client.detect_document_text.side_effect = ClientError(
-                    {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
-                    "DetectDocumentText",
-                )
-                mock_boto3.client.return_value = mock_client
-                mock_boto3.Session.return_value.client.return_value = mock_client
-
-                backend = AWSTextractBackend()
-
-                with pytest.raises(RuntimeError, match="rate limit"):
-                    backend.parse(sample_pdf)
-
-        except ImportError:
-            pytest.skip("boto3 not installed")
-
-    def test_parse_invalid_parameter_error(self, sample_pdf: Path):
-        """Backend should handle invalid parameter errors."""
-        try:
-            from pdfsmith.backends.aws_textract_backend import (
-                AWSTextractBackend,
-                AVAILABLE,
-            )
-            from botocore.exceptions import ClientError
-
-            if not AVAILABLE:
-                pytest.skip("boto3 not installed")
-
-            with patch("pdfsmith.backends.aws_textract_backend.boto3") as mock_boto3:
-                mock_client = Mock()
-                mock_client.detect_document_text.side_effect = ClientError(
-                    {"Error": {"Code": "InvalidParameterException", "Message": "Invalid PDF"}},
-                    "DetectDocumentText",
-                )
-                mock_boto3.client.return_value = mock_client
-                mock_boto3.Session.return_value.client.return_value = mock_client
-
-                backend = AWSTextractBackend()
-
-                with pytest.raises(ValueError, match="Invalid PDF"):
-                    backend.parse(sample_pdf)
-
-        except ImportError:
-            pytest.skip("boto3 not installed")
-
-    def test_extract_blocks_filters_non_line(self):
-        """_extract_blocks should only extract LINE blocks."""
-        try:
-            from pdfsmith.backends.aws_textract_backend import (
-                AWSTextractBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("boto3 not installed")
-
-            with patch("pdfsmith.backends.aws_textract_backend.boto3") as mock_boto3:
-                mock_boto3.client.return_value = Mock()
-                mock_boto3.Session.return_value.client.return_value = Mock()
-                backend = AWSTextractBackend()
-
-                response = {
-                    "Blocks": [
-                        {"BlockType": "PAGE", "Text": "Page 1"},
-                        {"BlockType": "LINE", "Text": "Line 1"},
-                        {"BlockType": "WORD", "Text": "Word"},
-                        {"BlockType": "LINE", "Text": "Line 2"},
-                        {"BlockType": "LINE", "Text": ""},  # Empty line
-                    ]
-                }
-
-                blocks = backend._extract_blocks(response)
-                assert blocks == ["Line 1", "Line 2"]
-
-        except ImportError:
-            pytest.skip("boto3 not installed")
-
-    def test_extract_blocks_empty_response(self):
-        """_extract_blocks should handle empty response."""
-        try:
-            from pdfsmith.backends.aws_textract_backend import (
-                AWSTextractBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("boto3 not installed")
-
-            with patch("pdfsmith.backends.aws_textract_backend.boto3") as mock_boto3:
-                mock_boto3.client.return_value = Mock()
-                mock_boto3.Session.return_value.client.return_value = Mock()
-                backend = AWSTextractBackend()
-
-                response = {"Blocks": []}
-                blocks = backend._extract_blocks(response)
-                assert blocks == []
-
-                response = {}
-                blocks = backend._extract_blocks(response)
-                assert blocks == []
-
-        except ImportError:
-            pytest.skip("boto3 not installed")
-
-
-class TestAzureDocumentIntelligenceBackend:
-    """Tests for Azure Document Intelligence backend."""
-
-    def test_import(self):
-        """Backend should be importable."""
-        try:
-            from pdfsmith.backends.azure_document_intelligence_backend import (
-                AzureDocumentIntelligenceBackend,
-                AVAILABLE,
-            )
-
-            assert AzureDocumentIntelligenceBackend is not None
-        except ImportError:
-            pytest.skip("azure-ai-documentintelligence not installed")
-
-    def test_initialization_requires_credentials(self, env_vars):
-        """Backend should fail without Azure credentials."""
-        try:
-            from pdfsmith.backends.azure_document_intelligence_backend import (
-                AzureDocumentIntelligenceBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("azure-ai-documentintelligence not installed")
-
-            # Clear Azure env vars
-            for key in ["AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT", "AZURE_DOCUMENT_INTELLIGENCE_KEY"]:
-                if key in os.environ:
-                    del os.environ[key]
-
-            with pytest.raises(RuntimeError, match="AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT"):
-                AzureDocumentIntelligenceBackend()
-
-        except ImportError:
-            pytest.skip("azure-ai-documentintelligence not installed")
-
-    def test_initialization_missing_key(self, env_vars):
-        """Backend should fail without API key."""
-        try:
-            from pdfsmith.backends.azure_document_intelligence_backend import (
-                AzureDocumentIntelligenceBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("azure-ai-documentintelligence not installed")
-
-            # Set endpoint but not key
-            os.environ["AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT"] = (
-                "https://test.cognitiveservices.azure.com/"
-            )
-            for key in ["AZURE_DOCUMENT_INTELLIGENCE_KEY"]:
-                if key in os.environ:
-                    del os.environ[key]
-
-            with pytest.raises(RuntimeError, match="AZURE_DOCUMENT_INTELLIGENCE"):
-                AzureDocumentIntelligenceBackend()
-
-        except ImportError:
-            pytest.skip("azure-ai-documentintelligence not installed")
-
-    def test_parse_with_mocked_client(self, sample_pdf: Path, env_vars):
-        """Backend should parse PDF with mocked Azure client."""
-        try:
-            from pdfsmith.backends.azure_document_intelligence_backend import (
-                AzureDocumentIntelligenceBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("azure-ai-documentintelligence not installed")
-
-            # Set required env vars
-            os.environ["AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT"] = (
-                "https://test.cognitiveservices.azure.com/"
-            )
-            os.environ["AZURE_DOCUMENT_INTELLIGENCE_KEY"] = "test-key-32-characters-long-key"
-
-            # Mock Azure client
-            with patch(
-                "pdfsmith.backends.azure_document_intelligence_backend.DocumentIntelligenceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
-                mock_poller = Mock()
-
-                # Mock result structure
-                mock_result = Mock()
-                mock_result.pages = [
-                    Mock(
-                        lines=[
-                            Mock(content="Test Document Title"),
-                            Mock(content="This is paragraph one with some text content."),
-                        ]
-                    )
-                ]
-                mock_poller.result.return_value = mock_result
-                mock_client.begin_analyze_document.return_value = mock_poller
-                mock_client_class.return_value = mock_client
-
-                backend = AzureDocumentIntelligenceBackend()
-                result = backend.parse(sample_pdf)
-
-                assert isinstance(result, str)
-                assert len(result) > 0
-
-        except ImportError:
-            pytest.skip("azure-ai-documentintelligence not installed")
-
-    def test_parse_file_not_found(self, tmp_path: Path, env_vars):
-        """Backend should raise FileNotFoundError for missing file."""
-        try:
-            from pdfsmith.backends.azure_document_intelligence_backend import (
-                AzureDocumentIntelligenceBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("azure-ai-documentintelligence not installed")
-
-            os.environ["AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT"] = (
-                "https://test.cognitiveservices.azure.com/"
-            )
-            os.environ["AZURE_DOCUMENT_INTELLIGENCE_KEY"] = "test-key"
-
-            with patch(
-                "pdfsmith.backends.azure_document_intelligence_backend.DocumentIntelligenceClient"
-            ):
-                backend = AzureDocumentIntelligenceBackend()
-
-                with pytest.raises(FileNotFoundError):
-                    backend.parse(tmp_path / "nonexistent.pdf")
-
-        except ImportError:
-            pytest.skip("azure-ai-documentintelligence not installed")
-
-    def test_parse_file_too_large(self, tmp_path: Path, env_vars):
-        """Backend should raise ValueError for files over 500 MB."""
-        try:
-            from pdfsmith.backends.azure_document_intelligence_backend import (
-                AzureDocumentIntelligenceBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("azure-ai-documentintelligence not installed")
-
-            large_pdf = tmp_path / "large.pdf"
-            large_pdf.write_bytes(b"fake pdf content")
-
-            os.environ["AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT"] = (
-                "https://test.cognitiveservices.azure.com/"
-            )
-            os.environ["AZURE_DOCUMENT_INTELLIGENCE_KEY"] = "test-key"
-
-            with patch(
-                "pdfsmith.backends.azure_document_intelligence_backend.DocumentIntelligenceClient"
-            ):
-                backend = AzureDocumentIntelligenceBackend()
+from types import SimpleNamespace
+from unittest.mock import patch
 
-                # Mock file size to appear as 600 MB
-                with patch.object(Path, "stat") as mock_stat:
-                    mock_stat.return_value = Mock(st_size=600 * 1024 * 1024)
-
-                    with pytest.raises(ValueError, match="500 MB limit"):
-                        backend.parse(large_pdf)
-
-        except ImportError:
-            pytest.skip("azure-ai-documentintelligence not installed")
-
-    def test_parse_rate_limit_error(self, sample_pdf: Path, env_vars):
-        """Backend should handle rate limit errors."""
-        try:
-            from pdfsmith.backends.azure_document_intelligence_backend import (
-                AzureDocumentIntelligenceBackend,
-                AVAILABLE,
-            )
-            from azure.core.exceptions import HttpResponseError
-
-            if not AVAILABLE:
-                pytest.skip("azure-ai-documentintelligence not installed")
-
-            os.environ["AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT"] = (
-                "https://test.cognitiveservices.azure.com/"
-            )
-            os.environ["AZURE_DOCUMENT_INTELLIGENCE_KEY"] = "test-key"
-
-            with patch(
-                "pdfsmith.backends.azure_document_intelligence_backend.DocumentIntelligenceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
-                error = HttpResponseError(message="Rate limit exceeded")
-                error.status_code = 429
-                mock_client.begin_analyze_document.side_effect = error
-                mock_client_class.return_value = mock_client
-
-                backend = AzureDocumentIntelligenceBackend()
-
-                with pytest.raises(RuntimeError, match="rate limit"):
-                    backend.parse(sample_pdf)
-
-        except ImportError:
-            pytest.skip("azure-ai-documentintelligence not installed")
-
-    def test_parse_invalid_pdf_error(self, sample_pdf: Path, env_vars):
-        """Backend should handle invalid PDF errors."""
-        try:
-            from pdfsmith.backends.azure_document_intelligence_backend import (
-                AzureDocumentIntelligenceBackend,
-                AVAILABLE,
-            )
-            from azure.core.exceptions import HttpResponseError
-
-            if not AVAILABLE:
-                pytest.skip("azure-ai-documentintelligence not installed")
-
-            os.environ["AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT"] = (
-                "https://test.cognitiveservices.azure.com/"
-            )
-            os.environ["AZURE_DOCUMENT_INTELLIGENCE_KEY"] = "test-key"
-
-            with patch(
-                "pdfsmith.backends.azure_document_intelligence_backend.DocumentIntelligenceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
-                error = HttpResponseError(message="Invalid document format")
-                error.status_code = 400
-                mock_client.begin_analyze_document.side_effect = error
-                mock_client_class.return_value = mock_client
-
-                backend = AzureDocumentIntelligenceBackend()
-
-                with pytest.raises(ValueError, match="Invalid PDF"):
-                    backend.parse(sample_pdf)
-
-        except ImportError:
-            pytest.skip("azure-ai-documentintelligence not installed")
-
-    def test_extract_text_empty_pages(self, env_vars):
-        """_extract_text should handle empty pages."""
-        try:
-            from pdfsmith.backends.azure_document_intelligence_backend import (
-                AzureDocumentIntelligenceBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("azure-ai-documentintelligence not installed")
-
-            os.environ["AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT"] = (
-                "https://test.cognitiveservices.azure.com/"
-            )
-            os.environ["AZURE_DOCUMENT_INTELLIGENCE_KEY"] = "test-key"
-
-            with patch(
-                "pdfsmith.backends.azure_document_intelligence_backend.DocumentIntelligenceClient"
-            ):
-                backend = AzureDocumentIntelligenceBackend()
-
-                # Test with None pages
-                mock_result = Mock()
-                mock_result.pages = None
-                assert backend._extract_text(mock_result) == ""
-
-                # Test with empty pages list
-                mock_result.pages = []
-                assert backend._extract_text(mock_result) == ""
-
-                # Test with pages but no lines
-                mock_result.pages = [Mock(lines=None)]
-                assert backend._extract_text(mock_result) == ""
-
-        except ImportError:
-            pytest.skip("azure-ai-documentintelligence not installed")
-
-
-class TestGoogleDocumentAIBackend:
-    """Tests for Google Document AI backend."""
-
-    def test_import(self):
-        """Backend should be importable."""
-        try:
-            from pdfsmith.backends.google_document_ai_backend import (
-                GoogleDocumentAIBackend,
-                AVAILABLE,
-            )
-
-            assert GoogleDocumentAIBackend is not None
-        except ImportError:
-            pytest.skip("google-cloud-documentai not installed")
-
-    def test_initialization_requires_credentials(self, env_vars):
-        """Backend should fail without Google credentials."""
-        try:
-            from pdfsmith.backends.google_document_ai_backend import (
-                GoogleDocumentAIBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("google-cloud-documentai not installed")
-
-            # Clear Google env vars
-            for key in [
-                "GOOGLE_APPLICATION_CREDENTIALS",
-                "GOOGLE_CLOUD_PROJECT",
-                "GOOGLE_DOCUMENT_AI_PROCESSOR_ID",
-            ]:
-                if key in os.environ:
-                    del os.environ[key]
-
-            with pytest.raises(RuntimeError, match="GOOGLE_APPLICATION_CREDENTIALS"):
-                GoogleDocumentAIBackend()
-
-        except ImportError:
-            pytest.skip("google-cloud-documentai not installed")
-
-    def test_initialization_missing_project(self, env_vars):
-        """Backend should fail without project ID."""
-        try:
-            from pdfsmith.backends.google_document_ai_backend import (
-                GoogleDocumentAIBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("google-cloud-documentai not installed")
-
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "/tmp/fake-creds.json"
-            for key in ["GOOGLE_CLOUD_PROJECT", "GOOGLE_DOCUMENT_AI_PROCESSOR_ID"]:
-                if key in os.environ:
-                    del os.environ[key]
-
-            with pytest.raises(RuntimeError, match="GOOGLE_CLOUD_PROJECT"):
-                GoogleDocumentAIBackend()
-
-        except ImportError:
-            pytest.skip("google-cloud-documentai not installed")
-
-    def test_initialization_missing_processor(self, env_vars):
-        """Backend should fail without processor ID."""
-        try:
-            from pdfsmith.backends.google_document_ai_backend import (
-                GoogleDocumentAIBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("google-cloud-documentai not installed")
-
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "/tmp/fake-creds.json"
-            os.environ["GOOGLE_CLOUD_PROJECT"] = "test-project"
-            if "GOOGLE_DOCUMENT_AI_PROCESSOR_ID" in os.environ:
-                del os.environ["GOOGLE_DOCUMENT_AI_PROCESSOR_ID"]
-
-            with pytest.raises(RuntimeError, match="GOOGLE_DOCUMENT_AI_PROCESSOR_ID"):
-                GoogleDocumentAIBackend()
-
-        except ImportError:
-            pytest.skip("google-cloud-documentai not installed")
-
-    def test_parse_with_mocked_client(self, sample_pdf: Path, env_vars):
-        """Backend should parse PDF with mocked client."""
-        try:
-            from pdfsmith.backends.google_document_ai_backend import (
-                GoogleDocumentAIBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("google-cloud-documentai not installed")
-
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "/tmp/fake-creds.json"
-            os.environ["GOOGLE_CLOUD_PROJECT"] = "test-project"
-            os.environ["GOOGLE_DOCUMENT_AI_PROCESSOR_ID"] = "test-processor"
-
-            with patch(
-                "pdfsmith.backends.google_document_ai_backend.documentai.DocumentProcessorServiceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
-
-                # Mock result
-                mock_document = Mock()
-                mock_layout = Mock()
-                mock_segment = Mock()
-                mock_segment.start_index = 0
-                mock_segment.end_index = 10
-                mock_layout.text_anchor = Mock()
-                mock_layout.text_anchor.text_segments = [mock_segment]
-
-                mock_line = Mock()
-                mock_line.layout = mock_layout
-
-                mock_page = Mock()
-                mock_page.lines = [mock_line]
-
-                mock_document.pages = [mock_page]
-                mock_document.text = "Test text content"
-
-                mock_response = Mock()
-                mock_response.document = mock_document
-                mock_client.process_document.return_value = mock_response
-                mock_client_class.return_value = mock_client
-
-                backend = GoogleDocumentAIBackend()
-                result = backend.parse(sample_pdf)
-
-                assert isinstance(result, str)
-
-        except ImportError:
-            pytest.skip("google-cloud-documentai not installed")
+import pytest
 
-    def test_parse_file_not_found(self, tmp_path: Path, env_vars):
+from pdfsmith.backends.aws_textract_backend import AWSTextractBackend
+from pdfsmith.backends.azure_document_intelligence_backend import (
+    AzureDocumentIntelligenceBackend,
+)
+from pdfsmith.backends.databricks_backend import AVAILABLE as DATABRICKS_AVAILABLE
+from pdfsmith.backends.databricks_backend import DatabricksBackend
+from pdfsmith.backends.google_document_ai_backend import GoogleDocumentAIBackend
+from pdfsmith.backends.llamaparse_backend import LlamaParseBackend
+from tests._env import AZURE_ENV, DATABRICKS_ENV, GOOGLE_ENV
+from tests._markers import (
+    requires_aws,
+    requires_azure,
+    requires_databricks,
+    requires_google_docai,
+    requires_llamaparse,
+)
+
+if DATABRICKS_AVAILABLE:
+    from databricks.sdk.service.sql import StatementState
+
+
+@dataclass(frozen=True)
+class CloudBackendCase:
+    """What the shared cloud backend tests need to know about one backend."""
+
+    backend_class: type
+    client_patch_target: str  # SDK entry point to mock out during __init__
+    env: dict[str, str] = field(default_factory=dict)
+    size_limit_mb: int = 0
+    size_limit_match: str = ""
+
+
+CLOUD_BACKENDS = [
+    pytest.param(
+        CloudBackendCase(
+            backend_class=AWSTextractBackend,
+            client_patch_target="pdfsmith.backends.aws_textract_backend.boto3",
+            size_limit_mb=10,
+            size_limit_match="10 MB limit",
+        ),
+        id="aws",
+        marks=requires_aws,
+    ),
+    pytest.param(
+        CloudBackendCase(
+            backend_class=AzureDocumentIntelligenceBackend,
+            client_patch_target=(
+                "pdfsmith.backends.azure_document_intelligence_backend"
+                ".DocumentIntelligenceClient"
+            ),
+            env=AZURE_ENV,
+            size_limit_mb=500,
+            size_limit_match="500 MB limit",
+        ),
+        id="azure",
+        marks=requires_azure,
+    ),
+    pytest.param(
+        CloudBackendCase(
+            backend_class=GoogleDocumentAIBackend,
+            client_patch_target=(
+                "pdfsmith.backends.google_document_ai_backend"
+                ".documentai.DocumentProcessorServiceClient"
+            ),
+            env=GOOGLE_ENV,
+            size_limit_mb=20,
+            size_limit_match="20 MB limit",
+        ),
+        id="google",
+        marks=requires_google_docai,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "module,cls",
+    [
+        ("pdfsmith.backends.aws_textract_backend", "AWSTextractBackend"),
+        (
+            "pdfsmith.backends.azure_document_intelligence_backend",
+            "AzureDocumentIntelligenceBackend",
+        ),
+        ("pdfsmith.backends.google_document_ai_backend", "GoogleDocumentAIBackend"),
+        ("pdfsmith.backends.databricks_backend", "DatabricksBackend"),
+        ("pdfsmith.backends.llamaparse_backend", "LlamaParseBackend"),
+    ],
+)
+def test_backend_importable(module: str, cls: str):
+    """Backend modules should import even when their SDK is missing."""
+    mod = pytest.importorskip(module)
+    assert getattr(mod, cls) is not None
+
+
+@pytest.mark.parametrize("case", CLOUD_BACKENDS)
+class TestCloudBackendCommon:
+    """Behaviour shared by the AWS, Azure and Google backends."""
+
+    @pytest.fixture
+    def backend(self, case: CloudBackendCase, monkeypatch):
+        """Backend instance with its SDK client mocked out."""
+        for key, value in case.env.items():
+            monkeypatch.setenv(key, value)
+        with patch(case.client_patch_target):
+            yield case.backend_class()
+
+    def test_parse_file_not_found(self, backend, tmp_path: Path):
         """Backend should raise FileNotFoundError for missing file."""
-        try:
-            from pdfsmith.backends.google_document_ai_backend import (
-                GoogleDocumentAIBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("google-cloud-documentai not installed")
-
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "/tmp/fake-creds.json"
-            os.environ["GOOGLE_CLOUD_PROJECT"] = "test-project"
-            os.environ["GOOGLE_DOCUMENT_AI_PROCESSOR_ID"] = "test-processor"
-
-            with patch(
-                "pdfsmith.backends.google_document_ai_backend.documentai.DocumentProcessorServiceClient"
-            ):
-                backend = GoogleDocumentAIBackend()
-
-                with pytest.raises(FileNotFoundError):
-                    backend.parse(tmp_path / "nonexistent.pdf")
-
-        except ImportError:
-            pytest.skip("google-cloud-documentai not installed")
-
-    def test_parse_file_too_large(self, tmp_path: Path, env_vars):
-        """Backend should raise ValueError for files over 20 MB."""
-        try:
-            from pdfsmith.backends.google_document_ai_backend import (
-                GoogleDocumentAIBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("google-cloud-documentai not installed")
-
-            large_pdf = tmp_path / "large.pdf"
-            large_pdf.write_bytes(b"fake pdf content")
-
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "/tmp/fake-creds.json"
-            os.environ["GOOGLE_CLOUD_PROJECT"] = "test-project"
-            os.environ["GOOGLE_DOCUMENT_AI_PROCESSOR_ID"] = "test-processor"
-
-            with patch(
-                "pdfsmith.backends.google_document_ai_backend.documentai.DocumentProcessorServiceClient"
-            ):
-                backend = GoogleDocumentAIBackend()
-
-                # Mock file size to appear as 25 MB
-                with patch.object(Path, "stat") as mock_stat:
-                    mock_stat.return_value = Mock(st_size=25 * 1024 * 1024)
-
-                    with pytest.raises(ValueError, match="20 MB limit"):
-                        backend.parse(large_pdf)
-
-        except ImportError:
-            pytest.skip("google-cloud-documentai not installed")
-
-    def test_parse_page_limit_exceeded(self, tmp_path: Path, env_vars):
-        """Backend should raise ValueError for PDFs over 15 pages."""
-        try:
-            from pdfsmith.backends.google_document_ai_backend import (
-                GoogleDocumentAIBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("google-cloud-documentai not installed")
-
-            # Create a real PDF file with 20 pages
-            try:
-                from reportlab.pdfgen import canvas
-                from reportlab.lib.pagesizes import letter
-
-                pdf_path = tmp_path / "manypage.pdf"
-                c = canvas.Canvas(str(pdf_path), pagesize=letter)
-                for i in range(20):
-                    c.drawString(100, 750, f"Page {i + 1}")
-                    c.showPage()
-                c.save()
-            except ImportError:
-                pytest.skip("reportlab not installed")
-
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "/tmp/fake-creds.json"
-            os.environ["GOOGLE_CLOUD_PROJECT"] = "test-project"
-            os.environ["GOOGLE_DOCUMENT_AI_PROCESSOR_ID"] = "test-processor"
-
-            with patch(
-                "pdfsmith.backends.google_document_ai_backend.documentai.DocumentProcessorServiceClient"
-            ):
-                backend = GoogleDocumentAIBackend()
-
-                # The real fitz will read the 20-page PDF and raise ValueError
-                with pytest.raises(ValueError, match="15 pages"):
-                    backend.parse(pdf_path)
-
-        except ImportError:
-            pytest.skip("google-cloud-documentai not installed")
-
-    def test_parse_invalid_argument_error(self, sample_pdf: Path, env_vars):
-        """Backend should handle INVALID_ARGUMENT errors."""
-        try:
-            from pdfsmith.backends.google_document_ai_backend import (
-                GoogleDocumentAIBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("google-cloud-documentai not installed")
-
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "/tmp/fake-creds.json"
-            os.environ["GOOGLE_CLOUD_PROJECT"] = "test-project"
-            os.environ["GOOGLE_DOCUMENT_AI_PROCESSOR_ID"] = "test-processor"
-
-            with patch(
-                "pdfsmith.backends.google_document_ai_backend.documentai.DocumentProcessorServiceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
-                mock_client.process_document.side_effect = Exception("INVALID_ARGUMENT: Bad PDF")
-                mock_client_class.return_value = mock_client
-
-                backend = GoogleDocumentAIBackend()
-
-                with pytest.raises(ValueError, match="Invalid PDF"):
-                    backend.parse(sample_pdf)
+        with pytest.raises(FileNotFoundError):
+            backend.parse(tmp_path / "nonexistent.pdf")
 
-        except ImportError:
-            pytest.skip("google-cloud-documentai not installed")
+    def test_parse_file_too_large(
+        self, backend, case: CloudBackendCase, make_sized_pdf
+    ):
+        """Backend should raise ValueError for files over its size limit."""
+        large_pdf = make_sized_pdf(case.size_limit_mb + 5)
 
-    def test_parse_rate_limit_error(self, sample_pdf: Path, env_vars):
-        """Backend should handle RESOURCE_EXHAUSTED errors."""
-        try:
-            from pdfsmith.backends.google_document_ai_backend import (
-                GoogleDocumentAIBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("google-cloud-documentai not installed")
-
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "/tmp/fake-creds.json"
-            os.environ["GOOGLE_CLOUD_PROJECT"] = "test-project"
-            os.environ["GOOGLE_DOCUMENT_AI_PROCESSOR_ID"] = "test-processor"
-
-            with patch(
-                "pdfsmith.backends.google_document_ai_backend.documentai.DocumentProcessorServiceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
-                mock_client.process_document.side_effect = Exception("RESOURCE_EXHAUSTED: Quota exceeded")
-                mock_client_class.return_value = mock_client
-
-                backend = GoogleDocumentAIBackend()
-
-                with pytest.raises(RuntimeError, match="rate limit"):
-                    backend.parse(sample_pdf)
-
-        except ImportError:
-            pytest.skip("google-cloud-documentai not installed")
-
-    def test_extract_text_empty_pages(self, env_vars):
-        """_extract_text should handle empty document."""
-        try:
-            from pdfsmith.backends.google_document_ai_backend import (
-                GoogleDocumentAIBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("google-cloud-documentai not installed")
-
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "/tmp/fake-creds.json"
-            os.environ["GOOGLE_CLOUD_PROJECT"] = "test-project"
-            os.environ["GOOGLE_DOCUMENT_AI_PROCESSOR_ID"] = "test-processor"
-
-            with patch(
-                "pdfsmith.backends.google_document_ai_backend.documentai.DocumentProcessorServiceClient"
-            ):
-                backend = GoogleDocumentAIBackend()
-
-                # Test with None pages
-                mock_document = Mock()
-                mock_document.pages = None
-                assert backend._extract_text(mock_document) == ""
-
-                # Test with empty pages
-                mock_document.pages = []
-                assert backend._extract_text(mock_document) == ""
-
-        except ImportError:
-            pytest.skip("google-cloud-documentai not installed")
-
-    def test_get_text_from_layout_no_anchor(self, env_vars):
-        """_get_text_from_layout should handle missing text_anchor."""
-        try:
-            from pdfsmith.backends.google_document_ai_backend import (
-                GoogleDocumentAIBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("google-cloud-documentai not installed")
-
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "/tmp/fake-creds.json"
-            os.environ["GOOGLE_CLOUD_PROJECT"] = "test-project"
-            os.environ["GOOGLE_DOCUMENT_AI_PROCESSOR_ID"] = "test-processor"
-
-            with patch(
-                "pdfsmith.backends.google_document_ai_backend.documentai.DocumentProcessorServiceClient"
-            ):
-                backend = GoogleDocumentAIBackend()
-
-                # Test with no text_anchor
-                mock_layout = Mock()
-                mock_layout.text_anchor = None
-                assert backend._get_text_from_layout(mock_layout, "test") == ""
-
-                # Test with no text_segments
-                mock_layout.text_anchor = Mock()
-                mock_layout.text_anchor.text_segments = None
-                assert backend._get_text_from_layout(mock_layout, "test") == ""
-
-        except ImportError:
-            pytest.skip("google-cloud-documentai not installed")
+        with pytest.raises(ValueError, match=case.size_limit_match):
+            backend.parse(large_pdf)
 
 
+@requires_databricks
 class TestDatabricksBackend:
     """Tests for Databricks backend."""
 
-    def test_import(self):
-        """Backend should be importable."""
-        try:
-            from pdfsmith.backends.databricks_backend import (
-                DatabricksBackend,
-                AVAILABLE,
-            )
-
-            assert DatabricksBackend is not None
-        except ImportError:
-            pytest.skip("databricks-sdk not installed")
-
-    def test_initialization_requires_credentials(self, env_vars):
-        """Backend should fail without Databricks credentials."""
-        try:
-            from pdfsmith.backends.databricks_backend import (
-                DatabricksBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("databricks-sdk not installed")
-
-            # Clear Databricks env vars
-            for key in list(os.environ.keys()):
-                if key.startswith("DATABRICKS_"):
-                    del os.environ[key]
-
-            with pytest.raises(RuntimeError, match="DATABRICKS_HOST"):
-                DatabricksBackend()
-
-        except ImportError:
-            pytest.skip("databricks-sdk not installed")
-
-    def test_initialization_missing_client_credentials(self, env_vars):
-        """Backend should fail without client credentials."""
-        try:
-            from pdfsmith.backends.databricks_backend import (
-                DatabricksBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("databricks-sdk not installed")
-
-            # Clear all and set only host
-            for key in list(os.environ.keys()):
-                if key.startswith("DATABRICKS_"):
-                    del os.environ[key]
-            os.environ["DATABRICKS_HOST"] = "https://test.cloud.databricks.com"
-
-            with pytest.raises(RuntimeError, match="DATABRICKS_CLIENT_ID"):
-                DatabricksBackend()
-
-        except ImportError:
-            pytest.skip("databricks-sdk not installed")
-
-    def test_parse_with_mocked_client(self, sample_pdf: Path, env_vars):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def workspace_client_class(cls):
+        """WorkspaceClient, patched once for the whole class."""
+        with patch(
+            "pdfsmith.backends.databricks_backend.WorkspaceClient"
+        ) as client_class:
+            yield client_class
+
+    @pytest.fixture(autouse=True)
+    def workspace_client(self, workspace_client_class):
+        """The mocked client every backend receives, reset between tests.
+
+        The client is reset in place so backends shared across tests keep
+        pointing at it.
+        """
+        workspace_client_class.reset_mock()
+        client = workspace_client_class.return_value
+        client.reset_mock(return_value=True, side_effect=True)
+        return client
+
+    @pytest.fixture
+    def databricks_env(self, monkeypatch):
+        """Set the full set of Databricks credentials for a test."""
+        for key, value in DATABRICKS_ENV.items():
+            monkeypatch.setenv(key, value)
+
+    @pytest.fixture
+    def databricks_env_no_warehouse(self, databricks_env, monkeypatch):
+        """Databricks credentials without a warehouse, forcing auto-detection."""
+        monkeypatch.delenv("DATABRICKS_WAREHOUSE_ID")
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def databricks_backend(cls, workspace_client_class) -> DatabricksBackend:
+        """One backend built from DATABRICKS_ENV, shared by the whole class."""
+        with pytest.MonkeyPatch.context() as mp:
+            for key, value in DATABRICKS_ENV.items():
+                mp.setenv(key, value)
+            return DatabricksBackend()
+
+    @pytest.mark.parametrize(
+        "present,match",
+        [
+            ((), "DATABRICKS_HOST"),
+            (("DATABRICKS_HOST",), "DATABRICKS_CLIENT_ID"),
+        ],
+        ids=["no-credentials", "host-only"],
+    )
+    def test_initialization_missing_credentials(self, monkeypatch, present, match):
+        """Backend should name the credentials that are missing."""
+        for key, value in DATABRICKS_ENV.items():
+            if key in present:
+                monkeypatch.setenv(key, value)
+            else:
+                monkeypatch.delenv(key, raising=False)
+
+        with pytest.raises(RuntimeError, match=match):
+            DatabricksBackend()
+
+    def test_parse_with_mocked_client(
+        self, sample_pdf: Path, workspace_client, databricks_backend
+    ):
         """Backend should parse PDF with mocked Databricks client."""
-        try:
-            from pdfsmith.backends.databricks_backend import (
-                DatabricksBackend,
-                AVAILABLE,
+        # Statement execution response
+        workspace_client.statement_execution.execute_statement.return_value = (
+            SimpleNamespace(
+                status=SimpleNamespace(state=StatementState.SUCCEEDED, error=None),
+                result=SimpleNamespace(
+                    data_array=[['{"elements": [{"text": "Test Document"}]}']]
+                ),
             )
-            from databricks.sdk.service.sql import StatementState
-
-            if not AVAILABLE:
-                pytest.skip("databricks-sdk not installed")
+        )
 
-            # Set required env vars
-            os.environ["DATABRICKS_HOST"] = "https://test.cloud.databricks.com"
-            os.environ["DATABRICKS_CLIENT_ID"] = "test-client-id"
-            os.environ["DATABRICKS_CLIENT_SECRET"] = "test-secret"
-            os.environ["DATABRICKS_WAREHOUSE_ID"] = "test-warehouse"
+        result = databricks_backend.parse(sample_pdf)
 
-            # Mock Databricks SDK
-            with patch(
-                "pdfsmith.backends.databricks_backend.WorkspaceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
+        assert isinstance(result, str)
+        assert "Test Document" in result
 
-                # Mock statement execution response
-                mock_status = Mock()
-                mock_status.state = StatementState.SUCCEEDED
-                mock_status.error = None
-
-                mock_result = Mock()
-                mock_result.data_array = [['{"elements": [{"text": "Test Document"}]}']]
-
-                mock_statement = Mock()
-                mock_statement.status = mock_status
-                mock_statement.result = mock_result
-
-                mock_client.statement_execution.execute_statement.return_value = (
-                    mock_statement
-                )
-                mock_client.warehouses.list.return_value = []
-                mock_client_class.return_value = mock_client
-
-                backend = DatabricksBackend()
-                result = backend.parse(sample_pdf)
-
-                assert isinstance(result, str)
-                assert "Test Document" in result
-
-        except ImportError:
-            pytest.skip("databricks-sdk not installed")
-
-    def test_parse_file_not_found(self, tmp_path: Path, env_vars):
+    def test_parse_file_not_found(self, tmp_path: Path, databricks_backend):
         """Backend should raise FileNotFoundError for missing file."""
-        try:
-            from pdfsmith.backends.databricks_backend import (
-                DatabricksBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("databricks-sdk not installed")
-
-            os.environ["DATABRICKS_HOST"] = "https://test.cloud.databricks.com"
-            os.environ["DATABRICKS_CLIENT_ID"] = "test-client-id"
-            os.environ["DATABRICKS_CLIENT_SECRET"] = "test-secret"
-            os.environ["DATABRICKS_WAREHOUSE_ID"] = "test-warehouse"
+        with pytest.raises(FileNotFoundError):
+            databricks_backend.parse(tmp_path / "nonexistent.pdf")
 
-            with patch(
-                "pdfsmith.backends.databricks_backend.WorkspaceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
-                mock_client.warehouses.list.return_value = []
-                mock_client_class.return_value = mock_client
-
-                backend = DatabricksBackend()
-
-                with pytest.raises(FileNotFoundError):
-                    backend.parse(tmp_path / "nonexistent.pdf")
-
-        except ImportError:
-            pytest.skip("databricks-sdk not installed")
-
-    def test_parse_sql_execution_failure(self, sample_pdf: Path, env_vars):
+    def test_parse_sql_execution_failure(
+        self, sample_pdf: Path, workspace_client, databricks_backend
+    ):
         """Backend should handle SQL execution failures."""
-        try:
-            from pdfsmith.backends.databricks_backend import (
-                DatabricksBackend,
-                AVAILABLE,
+        # Failed statement
+        error = SimpleNamespace(message="SQL execution failed")
+        workspace_client.statement_execution.execute_statement.return_value = (
+            SimpleNamespace(
+                status=SimpleNamespace(state=StatementState.FAILED, error=error),
+                result=None,
             )
-            from databricks.sdk.service.sql import StatementState
-
-            if not AVAILABLE:
-                pytest.skip("databricks-sdk not installed")
-
-            os.environ["DATABRICKS_HOST"] = "https://test.cloud.databricks.com"
-            os.environ["DATABRICKS_CLIENT_ID"] = "test-client-id"
-            os.environ["DATABRICKS_CLIENT_SECRET"] = "test-secret"
-            os.environ["DATABRICKS_WAREHOUSE_ID"] = "test-warehouse"
-
-            with patch(
-                "pdfsmith.backends.databricks_backend.WorkspaceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
-
-                # Mock failed statement
-                mock_error = Mock()
-                mock_error.message = "SQL execution failed"
-
-                mock_status = Mock()
-                mock_status.state = StatementState.FAILED
-                mock_status.error = mock_error
-
-                mock_statement = Mock()
-                mock_statement.status = mock_status
-                mock_statement.result = None
+        )
 
-                mock_client.statement_execution.execute_statement.return_value = (
-                    mock_statement
-                )
-                mock_client.warehouses.list.return_value = []
-                mock_client_class.return_value = mock_client
+        with pytest.raises(RuntimeError, match="SQL execution failed"):
+            databricks_backend.parse(sample_pdf)
 
-                backend = DatabricksBackend()
-
-                with pytest.raises(RuntimeError, match="SQL execution failed"):
-                    backend.parse(sample_pdf)
-
-        except ImportError:
-            pytest.skip("databricks-sdk not installed")
-
-    def test_parse_empty_result(self, sample_pdf: Path, env_vars):
+    def test_parse_empty_result(
+        self, sample_pdf: Path, workspace_client, databricks_backend
+    ):
         """Backend should handle empty results gracefully."""
-        try:
-            from pdfsmith.backends.databricks_backend import (
-                DatabricksBackend,
-                AVAILABLE,
+        workspace_client.statement_execution.execute_statement.return_value = (
+            SimpleNamespace(
+                status=SimpleNamespace(state=StatementState.SUCCEEDED, error=None),
+                result=SimpleNamespace(data_array=None),  # Empty result
             )
-            from databricks.sdk.service.sql import StatementState
-
-            if not AVAILABLE:
-                pytest.skip("databricks-sdk not installed")
-
-            os.environ["DATABRICKS_HOST"] = "https://test.cloud.databricks.com"
-            os.environ["DATABRICKS_CLIENT_ID"] = "test-client-id"
-            os.environ["DATABRICKS_CLIENT_SECRET"] = "test-secret"
-            os.environ["DATABRICKS_WAREHOUSE_ID"] = "test-warehouse"
-
-            with patch(
-                "pdfsmith.backends.databricks_backend.WorkspaceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
-
-                mock_status = Mock()
-                mock_status.state = StatementState.SUCCEEDED
-
-                mock_result = Mock()
-                mock_result.data_array = None  # Empty result
-
-                mock_statement = Mock()
-                mock_statement.status = mock_status
-                mock_statement.result = mock_result
-
-                mock_client.statement_execution.execute_statement.return_value = (
-                    mock_statement
-                )
-                mock_client.warehouses.list.return_value = []
-                mock_client_class.return_value = mock_client
+        )
 
-                backend = DatabricksBackend()
-                result = backend.parse(sample_pdf)
+        result = databricks_backend.parse(sample_pdf)
 
-                assert result == ""
+        assert result == ""
 
-        except ImportError:
-            pytest.skip("databricks-sdk not installed")
-
-    def test_get_warehouse_id_prefers_serverless(self, env_vars):
+    def test_get_warehouse_id_prefers_serverless(
+        self, workspace_client, databricks_env_no_warehouse
+    ):
         """_get_warehouse_id should prefer serverless warehouses."""
-        try:
-            from pdfsmith.backends.databricks_backend import (
-                DatabricksBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("databricks-sdk not installed")
-
-            os.environ["DATABRICKS_HOST"] = "https://test.cloud.databricks.com"
-            os.environ["DATABRICKS_CLIENT_ID"] = "test-client-id"
-            os.environ["DATABRICKS_CLIENT_SECRET"] = "test-secret"
-            # Don't set warehouse ID to test auto-detection
-
-            with patch(
-                "pdfsmith.backends.databricks_backend.WorkspaceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
-
-                # Create mock warehouses
-                mock_serverless = Mock()
-                mock_serverless.name = "Serverless Warehouse"
-                mock_serverless.id = "serverless-id"
-
-                mock_standard = Mock()
-                mock_standard.name = "Standard Warehouse"
-                mock_standard.id = "standard-id"
+        workspace_client.warehouses.list.return_value = [
+            SimpleNamespace(name="Standard Warehouse", id="standard-id"),
+            SimpleNamespace(name="Serverless Warehouse", id="serverless-id"),
+        ]
 
-                mock_client.warehouses.list.return_value = [mock_standard, mock_serverless]
-                mock_client_class.return_value = mock_client
+        backend = DatabricksBackend()
+        assert backend.warehouse_id == "serverless-id"
 
-                backend = DatabricksBackend()
-                assert backend.warehouse_id == "serverless-id"
+    def test_explicit_warehouse_id_skips_listing(
+        self, workspace_client, databricks_env
+    ):
+        """A configured DATABRICKS_WAREHOUSE_ID should not list warehouses."""
+        backend = DatabricksBackend()
 
-        except ImportError:
-            pytest.skip("databricks-sdk not installed")
+        assert backend.warehouse_id == "test-warehouse"
+        workspace_client.warehouses.list.assert_not_called()
 
-    def test_get_warehouse_id_no_warehouses(self, env_vars):
+    def test_get_warehouse_id_no_warehouses(
+        self, workspace_client, databricks_env_no_warehouse
+    ):
         """_get_warehouse_id should raise if no warehouses found."""
-        try:
-            from pdfsmith.backends.databricks_backend import (
-                DatabricksBackend,
-                AVAILABLE,
-            )
+        workspace_client.warehouses.list.return_value = []
 
-            if not AVAILABLE:
-                pytest.skip("databricks-sdk not installed")
+        with pytest.raises(ValueError, match="No SQL warehouses found"):
+            DatabricksBackend()
 
-            os.environ["DATABRICKS_HOST"] = "https://test.cloud.databricks.com"
-            os.environ["DATABRICKS_CLIENT_ID"] = "test-client-id"
-            os.environ["DATABRICKS_CLIENT_SECRET"] = "test-secret"
-            # Don't set warehouse ID
-
-            with patch(
-                "pdfsmith.backends.databricks_backend.WorkspaceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
-                mock_client.warehouses.list.return_value = []
-                mock_client_class.return_value = mock_client
-
-                with pytest.raises(ValueError, match="No SQL warehouses found"):
-                    DatabricksBackend()
-
-        except ImportError:
-            pytest.skip("databricks-sdk not installed")
-
-    def test_parse_result_json(self, env_vars):
+    def test_parse_result_json(self, databricks_backend):
         """_parse_result should handle valid JSON."""
-        try:
-            from pdfsmith.backends.databricks_backend import (
-                DatabricksBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("databricks-sdk not installed")
-
-            os.environ["DATABRICKS_HOST"] = "https://test.cloud.databricks.com"
-            os.environ["DATABRICKS_CLIENT_ID"] = "test-client-id"
-            os.environ["DATABRICKS_CLIENT_SECRET"] = "test-secret"
-            os.environ["DATABRICKS_WAREHOUSE_ID"] = "test-warehouse"
-
-            with patch(
-                "pdfsmith.backends.databricks_backend.WorkspaceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
-                mock_client.warehouses.list.return_value = []
-                mock_client_class.return_value = mock_client
-
-                backend = DatabricksBackend()
-
-                # Test valid JSON with elements
-                result = backend._parse_result(
-                    '{"elements": [{"text": "Line 1"}, {"text": "Line 2"}]}'
-                )
-                assert "Line 1" in result
-                assert "Line 2" in result
-
-                # Test empty elements
-                result = backend._parse_result('{"elements": []}')
-                assert result == ""
-
-        except ImportError:
-            pytest.skip("databricks-sdk not installed")
-
-    def test_parse_result_invalid_json(self, env_vars):
-        """_parse_result should handle non-JSON strings."""
-        try:
-            from pdfsmith.backends.databricks_backend import (
-                DatabricksBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("databricks-sdk not installed")
-
-            os.environ["DATABRICKS_HOST"] = "https://test.cloud.databricks.com"
-            os.environ["DATABRICKS_CLIENT_ID"] = "test-client-id"
-            os.environ["DATABRICKS_CLIENT_SECRET"] = "test-secret"
-            os.environ["DATABRICKS_WAREHOUSE_ID"] = "test-warehouse"
-
-            with patch(
-                "pdfsmith.backends.databricks_backend.WorkspaceClient"
-            ) as mock_client_class:
-                mock_client = Mock()
-                mock_client.warehouses.list.return_value = []
-                mock_client_class.return_value = mock_client
-
-                backend = DatabricksBackend()
-
-                # Invalid JSON should return as-is
-                result = backend._parse_result("Plain text result")
-                assert result == "Plain text result"
-
-        except ImportError:
-            pytest.skip("databricks-sdk not installed")
-
-
+        # Test valid JSON with elements
+        result = databricks_backend._parse_result(
+            '{"elements": [{"text": "Line 1"}, {"text": "Line 2"}]}'
+        )
+        assert "Line 1" in result
+        assert "Line 2" in result
+
+        # Test empty elements
+        result = databricks_backend._parse_result('{"elements": []}')
+        assert result == ""
+
+    @pytest.mark.parametrize(
+        "result_json",
+        ["Plain text result", "42", '"text"', ""],
+        ids=["plain-text", "bare-number", "bare-string", "empty"],
+    )
+    def test_parse_result_unstructured(self, databricks_backend, result_json):
+        """Anything but a JSON object or array should be returned as-is."""
+        assert databricks_backend._parse_result(result_json) == result_json
+
+    def test_parse_result_leading_whitespace(self, databricks_backend):
+        """JSON preceded by whitespace should still be parsed."""
+        result = databricks_backend._parse_result(
+            '\n  {"elements": [{"text": "Line 1"}]}'
+        )
+        assert result == "Line 1"
+
+
+@requires_llamaparse
 class TestLlamaParseBackend:
     """Tests for LlamaParse backend."""
 
-    def test_import(self):
-        """Backend should be importable."""
-        try:
-            from pdfsmith.backends.llamaparse_backend import (
-                LlamaParseBackend,
-                AVAILABLE,
-            )
-
-            assert LlamaParseBackend is not None
-        except ImportError:
-            pytest.skip("llama-parse not installed")
-
-    def test_missing_api_key(self, env_vars):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def llamaparse_class(cls):
+        """LlamaParse, patched once for the whole class."""
+        with patch("pdfsmith.backends.llamaparse_backend.LlamaParse") as client_class:
+            yield client_class
+
+    @pytest.fixture(autouse=True)
+    def llamaparse_client(self, llamaparse_class):
+        """The mocked client every backend receives, reset between tests.
+
+        The client is reset in place so backends shared across tests keep
+        pointing at it.
+        """
+        llamaparse_class.reset_mock()
+        client = llamaparse_class.return_value
+        client.reset_mock(return_value=True, side_effect=True)
+        return client
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def llamaparse_backend(cls, llamaparse_class) -> LlamaParseBackend:
+        """One default backend, shared by the whole class."""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("LLAMA_CLOUD_API_KEY", "test-api-key")
+            return LlamaParseBackend()
+
+    def test_missing_api_key(self, monkeypatch):
         """Backend should fail without API key."""
-        try:
-            from pdfsmith.backends.llamaparse_backend import (
-                LlamaParseBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("llama-parse not installed")
+        # Clear API key
+        monkeypatch.delenv("LLAMA_CLOUD_API_KEY", raising=False)
 
-            # Clear API key
-            os.environ.pop("LLAMA_CLOUD_API_KEY", None)
+        with pytest.raises(ValueError, match="LLAMA_CLOUD_API_KEY"):
+            LlamaParseBackend()
 
-            with pytest.raises(ValueError, match="LLAMA_CLOUD_API_KEY"):
-                LlamaParseBackend()
-
-        except ImportError:
-            pytest.skip("llama-parse not installed")
-
-    def test_invalid_parsing_mode(self, env_vars):
+    def test_invalid_parsing_mode(self, monkeypatch):
         """Backend should reject invalid parsing mode."""
-        try:
-            from pdfsmith.backends.llamaparse_backend import (
-                LlamaParseBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("llama-parse not installed")
-
-            os.environ["LLAMA_CLOUD_API_KEY"] = "test-key"
+        monkeypatch.setenv("LLAMA_CLOUD_API_KEY", "test-key")
 
-            with patch("pdfsmith.backends.llamaparse_backend.LlamaParse"):
-                with pytest.raises(ValueError, match="Invalid parsing_mode"):
-                    LlamaParseBackend(parsing_mode="invalid")
+        with pytest.raises(ValueError, match="Invalid parsing_mode"):
+            LlamaParseBackend(parsing_mode="invalid")
 
-        except ImportError:
-            pytest.skip("llama-parse not installed")
-
-    def test_initialization_with_api_key(self, env_vars):
+    def test_initialization_with_api_key(
+        self, llamaparse_class, llamaparse_client, monkeypatch
+    ):
         """Backend should initialize with API key."""
-        try:
-            from pdfsmith.backends.llamaparse_backend import (
-                LlamaParseBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("llama-parse not installed")
-
-            os.environ["LLAMA_CLOUD_API_KEY"] = "test-api-key"
-
-            with patch("pdfsmith.backends.llamaparse_backend.LlamaParse") as mock_class:
-                mock_client = Mock()
-                mock_class.return_value = mock_client
+        monkeypatch.setenv("LLAMA_CLOUD_API_KEY", "test-api-key")
 
-                backend = LlamaParseBackend()
-                assert backend.client is mock_client
-                assert backend.parsing_mode == "cost_effective"
+        backend = LlamaParseBackend()
+        assert backend.client is llamaparse_client
+        assert backend.parsing_mode == "cost_effective"
 
-                # Verify LlamaParse was called with correct params
-                mock_class.assert_called_once_with(
-                    api_key="test-api-key",
-                    result_type="markdown",
-                    language="en",
-                    verbose=False,
-                )
+        # Verify LlamaParse was called with correct params
+        llamaparse_class.assert_called_once_with(
+            api_key="test-api-key",
+            result_type="markdown",
+            language="en",
+            verbose=False,
+        )
 
-        except ImportError:
-            pytest.skip("llama-parse not installed")
-
-    def test_initialization_with_custom_params(self, env_vars):
+    def test_initialization_with_custom_params(self, monkeypatch):
         """Backend should accept custom parsing mode and language."""
-        try:
-            from pdfsmith.backends.llamaparse_backend import (
-                LlamaParseBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("llama-parse not installed")
-
-            os.environ["LLAMA_CLOUD_API_KEY"] = "test-api-key"
-
-            with patch("pdfsmith.backends.llamaparse_backend.LlamaParse") as mock_class:
-                mock_client = Mock()
-                mock_class.return_value = mock_client
+        monkeypatch.setenv("LLAMA_CLOUD_API_KEY", "test-api-key")
 
-                backend = LlamaParseBackend(parsing_mode="premium", language="de")
-                assert backend.parsing_mode == "premium"
-                assert backend.language == "de"
+        backend = LlamaParseBackend(parsing_mode="premium", language="de")
+        assert backend.parsing_mode == "premium"
+        assert backend.language == "de"
 
-        except ImportError:
-            pytest.skip("llama-parse not installed")
-
-    def test_parse_file_not_found(self, env_vars, tmp_path):
+    def test_parse_file_not_found(self, llamaparse_backend, tmp_path):
         """Backend should raise FileNotFoundError for missing file."""
-        try:
-            from pdfsmith.backends.llamaparse_backend import (
-                LlamaParseBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("llama-parse not installed")
-
-            os.environ["LLAMA_CLOUD_API_KEY"] = "test-api-key"
+        with pytest.raises(FileNotFoundError):
+            llamaparse_backend.parse(tmp_path / "nonexistent.pdf")
 
-            with patch("pdfsmith.backends.llamaparse_backend.LlamaParse"):
-                backend = LlamaParseBackend()
-
-                with pytest.raises(FileNotFoundError):
-                    backend.parse(tmp_path / "nonexistent.pdf")
-
-        except ImportError:
-            pytest.skip("llama-parse not installed")
-
-    def test_parse_with_mocked_client(self, env_vars, sample_pdf):
+    def test_parse_with_mocked_client(
+        self, llamaparse_backend, sample_pdf, llamaparse_client
+    ):
         """Backend should parse PDF using LlamaParse."""
-        try:
-            from pdfsmith.backends.llamaparse_backend import (
-                LlamaParseBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("llama-parse not installed")
-
-            os.environ["LLAMA_CLOUD_API_KEY"] = "test-api-key"
-
-            # Create mock document objects
-            mock_doc1 = Mock()
-            mock_doc1.text = "# Document Title\n\nFirst paragraph."
-
-            mock_doc2 = Mock()
-            mock_doc2.text = "Second paragraph with more content."
-
-            with patch("pdfsmith.backends.llamaparse_backend.LlamaParse") as mock_class:
-                mock_client = Mock()
-                mock_client.load_data.return_value = [mock_doc1, mock_doc2]
-                mock_class.return_value = mock_client
-
-                backend = LlamaParseBackend()
-                result = backend.parse(sample_pdf)
+        llamaparse_client.load_data.return_value = [
+            SimpleNamespace(text="# Document Title\n\nFirst paragraph."),
+            SimpleNamespace(text="Second paragraph with more content."),
+        ]
 
-                assert "# Document Title" in result
-                assert "First paragraph" in result
-                assert "Second paragraph" in result
+        result = llamaparse_backend.parse(sample_pdf)
 
-                mock_client.load_data.assert_called_once_with(str(sample_pdf))
+        assert "# Document Title" in result
+        assert "First paragraph" in result
+        assert "Second paragraph" in result
 
-        except ImportError:
-            pytest.skip("llama-parse not installed")
+        llamaparse_client.load_data.assert_called_once_with(str(sample_pdf))
 
-    def test_parse_with_content_attribute(self, env_vars, sample_pdf):
+    def test_parse_with_content_attribute(
+        self, llamaparse_backend, sample_pdf, llamaparse_client
+    ):
         """Backend should handle documents with content attribute."""
-        try:
-            from pdfsmith.backends.llamaparse_backend import (
-                LlamaParseBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("llama-parse not installed")
-
-            os.environ["LLAMA_CLOUD_API_KEY"] = "test-api-key"
-
-            # Create mock document with content instead of text
-            mock_doc = Mock(spec=[])  # No text attribute
-            mock_doc.content = "Content from content attribute"
-
-            with patch("pdfsmith.backends.llamaparse_backend.LlamaParse") as mock_class:
-                mock_client = Mock()
-                mock_client.load_data.return_value = [mock_doc]
-                mock_class.return_value = mock_client
-
-                backend = LlamaParseBackend()
-                result = backend.parse(sample_pdf)
+        # Document with content instead of text
+        llamaparse_client.load_data.return_value = [
+            SimpleNamespace(content="Content from content attribute")
+        ]
 
-                assert "Content from content attribute" in result
+        result = llamaparse_backend.parse(sample_pdf)
 
-        except ImportError:
-            pytest.skip("llama-parse not installed")
+        assert "Content from content attribute" in result
 
-    def test_parse_empty_documents(self, env_vars, sample_pdf):
+    def test_parse_empty_documents(self, llamaparse_backend, sample_pdf):
         """Backend should handle empty document list."""
-        try:
-            from pdfsmith.backends.llamaparse_backend import (
-                LlamaParseBackend,
-                AVAILABLE,
-            )
+        llamaparse_backend.client.load_data.return_value = []
 
-            if not AVAILABLE:
-                pytest.skip("llama-parse not installed")
+        result = llamaparse_backend.parse(sample_pdf)
 
-            os.environ["LLAMA_CLOUD_API_KEY"] = "test-api-key"
+        assert result == ""
 
-            with patch("pdfsmith.backends.llamaparse_backend.LlamaParse") as mock_class:
-                mock_client = Mock()
-                mock_client.load_data.return_value = []
-                mock_class.return_value = mock_client
-
-                backend = LlamaParseBackend()
-                result = backend.parse(sample_pdf)
-
-                assert result == ""
-
-        except ImportError:
-            pytest.skip("llama-parse not installed")
-
-    def test_parse_api_error(self, env_vars, sample_pdf):
+    def test_parse_api_error(self, llamaparse_backend, sample_pdf):
         """Backend should wrap API errors in RuntimeError."""
-        try:
-            from pdfsmith.backends.llamaparse_backend import (
-                LlamaParseBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("llama-parse not installed")
-
-            os.environ["LLAMA_CLOUD_API_KEY"] = "test-api-key"
-
-            with patch("pdfsmith.backends.llamaparse_backend.LlamaParse") as mock_class:
-                mock_client = Mock()
-                mock_client.load_data.side_effect = Exception("API rate limit exceeded")
-                mock_class.return_value = mock_client
-
-                backend = LlamaParseBackend()
-
-                with pytest.raises(RuntimeError, match="LlamaParse processing failed"):
-                    backend.parse(sample_pdf)
+        llamaparse_backend.client.load_data.side_effect = Exception(
+            "API rate limit exceeded"
+        )
 
-        except ImportError:
-            pytest.skip("llama-parse not installed")
+        with pytest.raises(RuntimeError, match="LlamaParse processing failed"):
+            llamaparse_backend.parse(sample_pdf)
 
     def test_parsing_modes(self):
         """Backend should define correct parsing modes."""
-        try:
-            from pdfsmith.backends.llamaparse_backend import (
-                LlamaParseBackend,
-                AVAILABLE,
-            )
-
-            if not AVAILABLE:
-                pytest.skip("llama-parse not installed")
-
-            assert "fast" in LlamaParseBackend.PARSING_MODES
-            assert "cost_effective" in LlamaParseBackend.PARSING_MODES
-            assert "agentic" in LlamaParseBackend.PARSING_MODES
-            assert "premium" in LlamaParseBackend.PARSING_MODES
-
-            # Verify costs
-            assert LlamaParseBackend.PARSING_MODES["fast"] == 0.001
-            assert LlamaParseBackend.PARSING_MODES["cost_effective"] == 0.003
-            assert LlamaParseBackend.PARSING_MODES["agentic"] == 0.01
-            assert LlamaParseBackend.PARSING_MODES["premium"] == 0.09
-
-        except ImportError:
-            pytest.skip("llama-parse not installed")
-
-
+        assert "fast" in LlamaParseBackend.PARSING_MODES
+        assert "cost_effective" in LlamaParseBackend.PARSING_MODES
+        assert "agentic" in LlamaParseBackend.PARSING_MODES
+        assert "premium" in LlamaParseBackend.PARSING_MODES
+
+        # Verify costs
+        assert LlamaParseBackend.PARSING_MODES["fast"] == 0.001
+        assert LlamaParseBackend.PARSING_MODES["cost_effective"] == 0.003
+        assert LlamaParseBackend.PARSING_MODES["agentic"] == 0.01
+        assert LlamaParseBackend.PARSING_MODES["premium"] == 0.09
+
+
+@pytest.mark.parametrize(
+    "backend_name",
+    [
+        "aws_textract",
+        "azure_document_intelligence",
+        "google_document_ai",
+        "databricks",
+        "llamaparse",
+    ],
+)
 class TestCommercialBackendRegistry:
     """Tests for commercial backend registration."""
 
-    def test_commercial_backends_registered(self):
-        """All commercial backends should be in registry."""
+    def test_commercial_backend_registered(self, backend_name):
+        """Each commercial backend should be in the registry."""
         from pdfsmith.backends.registry import BACKEND_REGISTRY
 
-        commercial_backends = [
-            "aws_textract",
-            "azure_document_intelligence",
-            "google_document_ai",
-            "databricks",
-            "llamaparse",
-        ]
-
-        for backend_name in commercial_backends:
-            assert backend_name in BACKEND_REGISTRY
-            info = BACKEND_REGISTRY[backend_name]
-            assert info.weight == "commercial"
+        assert backend_name in BACKEND_REGISTRY
+        assert BACKEND_REGISTRY[backend_name].weight == "commercial"
 
-    def test_commercial_backend_availability_check(self):
+    def test_commercial_backend_availability_check(self, backend_name):
         """Commercial backends should report availability correctly."""
         from pdfsmith.backends.registry import BACKEND_REGISTRY
 
-        # Check each commercial backend
-        for backend_name in [
-            "aws_textract",
-            "azure_document_intelligence",
-            "google_document_ai",
-            "databricks",
-            "llamaparse",
-        ]:
-            info = BACKEND_REGISTRY[backend_name]
-            # Should not raise error, just return True/False
-            available = info.is_available()
-            assert isinstance(available, bool)
+        # Should not raise error, just return True/False
+        available = BACKEND_REGISTRY[backend_name].is_available()
+        assert isinstance(available, bool)
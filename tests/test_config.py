@@ -1,6 +1,8 @@
 """Tests for the pdfsmith configuration system."""
 
+import dataclasses
 import os
+import pickle
 from pathlib import Path
 
 import pytest
@@ -12,6 +14,7 @@ from pdfsmith.config import (
     _load_env_config,
     _load_yaml_config,
     get_backend_defaults,
+    get_backend_defaults_mut,
     load_backend_config,
 )
 
@@ -90,67 +93,91 @@ class TestBackendConfig:
         config = BackendConfig(backend_name="test", source="explicit")
         assert config.source == "explicit"
 
+    def test_config_is_immutable(self):
+        """Config fields and options should be read-only."""
+        config = BackendConfig(backend_name="test", options={"flag": True})
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.source = "explicit"
+        with pytest.raises(TypeError):
+            config.options["flag"] = False
+
+    def test_config_pickles(self):
+        """Configs should survive pickling, e.g. to worker processes."""
+        config = BackendConfig(
+            backend_name="test", options={"langs": ["en"]}, source="explicit"
+        )
+
+        restored = pickle.loads(pickle.dumps(config))
+
+        assert restored == config
+        with pytest.raises(TypeError):
+            restored.options["langs"] = ["de"]
+
+    def test_config_is_unhashable(self):
+        """Configs hold a mapping, so hashing should fail like a dict's."""
+        with pytest.raises(TypeError, match="BackendConfig"):
+            hash(BackendConfig(backend_name="test"))
+
 
 class TestConfigFileFinding:
     """Tests for _find_config_file function."""
 
-    def test_find_local_config(self, tmp_path, monkeypatch):
+    def test_find_local_config(self, config_dirs):
         """Should find project-local config first."""
-        # Create local config
-        monkeypatch.chdir(tmp_path)
-        local_dir = tmp_path / ".pdfsmith"
-        local_dir.mkdir()
-        local_config = local_dir / "test.yaml"
-        local_config.write_text("key: value")
+        (config_dirs.local / "test.yaml").write_text("key: value")
 
         result = _find_config_file("test")
         assert result is not None
         assert result.name == "test.yaml"
 
-    def test_find_user_config(self, tmp_path, monkeypatch):
+    def test_find_user_config(self, config_dirs):
         """Should find user config if no local config."""
-        # Set up temp home directory
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        project_dir = tmp_path / "project"
-        project_dir.mkdir()
-        monkeypatch.chdir(project_dir)
-
-        # Create user config only
-        user_dir = tmp_path / ".config" / "pdfsmith"
-        user_dir.mkdir(parents=True)
-        user_config = user_dir / "test.yaml"
-        user_config.write_text("key: value")
+        (config_dirs.user / "test.yaml").write_text("key: value")
 
         result = _find_config_file("test")
         assert result is not None
         assert str(result).endswith("test.yaml")
 
-    def test_no_config_returns_none(self, tmp_path, monkeypatch):
+    def test_no_config_returns_none(self, config_dirs):
         """Should return None if no config found."""
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         result = _find_config_file("nonexistent")
         assert result is None
 
-    def test_local_takes_precedence(self, tmp_path, monkeypatch):
+    def test_local_takes_precedence(self, config_dirs):
         """Local config should be found before user config."""
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
-        # Create both local and user configs
-        local_dir = tmp_path / ".pdfsmith"
-        local_dir.mkdir()
-        (local_dir / "test.yaml").write_text("source: local")
-
-        user_dir = tmp_path / ".config" / "pdfsmith"
-        user_dir.mkdir(parents=True)
-        (user_dir / "test.yaml").write_text("source: user")
+        (config_dirs.local / "test.yaml").write_text("source: local")
+        (config_dirs.user / "test.yaml").write_text("source: user")
 
         result = _find_config_file("test")
         assert result is not None
         assert ".pdfsmith" in str(result)
 
+    def test_lookup_sees_created_and_deleted_configs(self, config_dirs):
+        """Configs created or deleted after a lookup should be seen."""
+        assert _find_config_file("test") is None
+
+        config_file = config_dirs.local / "test.yaml"
+        config_file.write_text("key: value")
+        assert _find_config_file("test") == Path(".pdfsmith/test.yaml")
+
+        config_file.unlink()
+        assert _find_config_file("test") is None
+
+    def test_lookup_cached_until_dir_changes(self, config_dirs):
+        """Settled directories should be listed once until their mtime moves."""
+        (config_dirs.local / "test.yaml").write_text("key: value")
+        os.utime(config_dirs.local, ns=(0, 0))
+
+        assert _find_config_file("test") == Path(".pdfsmith/test.yaml")
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("pdfsmith.config.os.scandir", None)  # Must not re-list
+            assert _find_config_file("test") == Path(".pdfsmith/test.yaml")
+
+        (config_dirs.local / "test.yaml").unlink()
+        os.utime(config_dirs.local, ns=(1, 1))
+        assert _find_config_file("test") is None
+
 
 class TestYAMLParsing:
     """Tests for _load_yaml_config function."""
@@ -174,6 +201,34 @@ list:
         assert result["nested"]["inner"] == "data"
         assert result["list"] == ["item1", "item2"]
 
+    def test_parsed_yaml_cached_until_file_changes(self, tmp_path):
+        """Unchanged files should come from the cache; edits should be re-read."""
+        yaml_file = tmp_path / "test.yaml"
+        yaml_file.write_text("key: value")
+
+        assert _load_yaml_config(yaml_file) == {"key": "value"}
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("pdfsmith.config._yaml_loader", None)  # Must not re-parse
+            assert _load_yaml_config(yaml_file) == {"key": "value"}
+
+        yaml_file.write_text("key: changed")
+        os.utime(yaml_file, ns=(0, 0))
+        assert _load_yaml_config(yaml_file)["key"] == "changed"
+
+    def test_cached_yaml_not_shared_between_callers(self, tmp_path):
+        """Mutating one load's nested values should not affect later loads."""
+        yaml_file = tmp_path / "test.yaml"
+        yaml_file.write_text("nested:\n  inner: data\nlist:\n  - item1\n")
+
+        first = _load_yaml_config(yaml_file)
+        first["nested"]["inner"] = "modified"
+        first["list"].append("item2")
+
+        assert _load_yaml_config(yaml_file) == {
+            "nested": {"inner": "data"},
+            "list": ["item1"],
+        }
+
     def test_empty_yaml(self, tmp_path):
         """Should return empty dict for empty YAML."""
         yaml_file = tmp_path / "empty.yaml"
@@ -239,39 +294,27 @@ class TestEnvConfig:
 class TestConfigLoading:
     """Tests for load_backend_config function."""
 
-    def test_load_defaults_only(self, tmp_path, monkeypatch, isolated_env):
+    def test_load_defaults_only(self, config_dirs, isolated_env):
         """Should use defaults when no other sources."""
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         config = load_backend_config("test")
         assert config.backend_name == "test"
         assert config.source == "defaults"
+        assert config.options == {}
+        assert load_backend_config("test") is config
 
-    def test_load_from_file(self, tmp_path, monkeypatch, isolated_env):
+    def test_load_from_file(self, config_dirs, isolated_env):
         """Should load config from YAML file."""
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
-        # Create config file
-        local_dir = tmp_path / ".pdfsmith"
-        local_dir.mkdir()
-        (local_dir / "test.yaml").write_text("ocr: true\nthreads: 8")
+        (config_dirs.local / "test.yaml").write_text("ocr: true\nthreads: 8")
 
         config = load_backend_config("test")
         assert config.get_bool("ocr") is True
         assert config.get_int("threads") == 8
         assert ".pdfsmith/test.yaml" in config.source
 
-    def test_env_var_override(self, tmp_path, monkeypatch):
+    def test_env_var_override(self, config_dirs, monkeypatch):
         """Environment variables should override file config."""
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         # Create config file
-        local_dir = tmp_path / ".pdfsmith"
-        local_dir.mkdir()
-        (local_dir / "docling.yaml").write_text("ocr: false")
+        (config_dirs.local / "docling.yaml").write_text("ocr: false")
 
         # Set env var
         monkeypatch.setenv("DOCLING_OCR", "true")
@@ -280,15 +323,10 @@ class TestConfigLoading:
         assert config.get_bool("ocr") is True
         assert config.source == "environment"
 
-    def test_explicit_override(self, tmp_path, monkeypatch):
+    def test_explicit_override(self, config_dirs, monkeypatch):
         """Explicit options should override all."""
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         # Create config file
-        local_dir = tmp_path / ".pdfsmith"
-        local_dir.mkdir()
-        (local_dir / "docling.yaml").write_text("ocr: false")
+        (config_dirs.local / "docling.yaml").write_text("ocr: false")
 
         # Set env var
         monkeypatch.setenv("DOCLING_OCR", "false")
@@ -301,15 +339,19 @@ class TestConfigLoading:
         assert config.get_bool("ocr") is True
         assert config.source == "explicit"
 
-    def test_precedence_order(self, tmp_path, monkeypatch):
-        """Test full precedence: explicit > env > file > defaults."""
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    def test_explicit_options_copied(self, config_dirs, isolated_env):
+        """Changing the caller's dict afterwards should not change the config."""
+        explicit = {"ocr": True}
+        config = load_backend_config("test", explicit_options=explicit)
+
+        explicit["ocr"] = False
+
+        assert config.get("ocr") is True
 
+    def test_precedence_order(self, config_dirs, monkeypatch):
+        """Test full precedence: explicit > env > file > defaults."""
         # Create config file with all options
-        local_dir = tmp_path / ".pdfsmith"
-        local_dir.mkdir()
-        (local_dir / "test.yaml").write_text(
+        (config_dirs.local / "test.yaml").write_text(
             "file_only: from_file\nenv_override: from_file\nexplicit_override: from_file"
         )
 
@@ -354,13 +396,22 @@ class TestBackendDefaults:
         defaults = get_backend_defaults("unknown_backend")
         assert defaults == {}
 
-    def test_defaults_are_copies(self):
-        """Should return copies, not references."""
-        defaults1 = get_backend_defaults("docling")
-        defaults2 = get_backend_defaults("docling")
+    def test_defaults_are_read_only(self):
+        """Should return a read-only view of the shared defaults."""
+        defaults = get_backend_defaults("docling")
+
+        with pytest.raises(TypeError):
+            defaults["do_ocr"] = "modified"
+        assert get_backend_defaults("docling")["do_ocr"] is False
+
+    def test_mutable_defaults_are_copies(self):
+        """get_backend_defaults_mut should return copies, not references."""
+        defaults1 = get_backend_defaults_mut("docling")
+        defaults2 = get_backend_defaults_mut("docling")
 
         defaults1["do_ocr"] = "modified"
         assert defaults2["do_ocr"] is False
+        assert get_backend_defaults("docling")["do_ocr"] is False
 
     def test_backend_defaults_constant(self):
         """BACKEND_DEFAULTS should have expected backends."""
@@ -0,0 +1,396 @@
+"""Tests for the Google Document AI backend.
+
+These tests use mocking to avoid requiring real API credentials.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pdfsmith.backends.google_document_ai_backend import (
+    STORAGE_AVAILABLE as GOOGLE_STORAGE_AVAILABLE,
+)
+from pdfsmith.backends.google_document_ai_backend import GoogleDocumentAIBackend
+from tests._env import GOOGLE_ENV
+from tests._markers import requires_google_docai
+
+
+@dataclass(frozen=True)
+class FakeTextSegment:
+    start_index: int = 0
+    end_index: int = 0
+
+
+@dataclass(frozen=True)
+class FakeTextAnchor:
+    text_segments: tuple[FakeTextSegment, ...] | None = None
+
+
+@dataclass(frozen=True)
+class FakeLayout:
+    text_anchor: FakeTextAnchor | None = None
+
+
+@dataclass(frozen=True)
+class FakeGoogleLine:
+    layout: FakeLayout
+
+
+@dataclass(frozen=True)
+class FakeGooglePage:
+    lines: tuple[FakeGoogleLine, ...] | None = None
+
+
+@dataclass(frozen=True)
+class FakeGoogleDocument:
+    text: str = ""
+    pages: tuple[FakeGooglePage, ...] | None = None
+
+
+def _google_line(start: int, end: int) -> FakeGoogleLine:
+    segment = FakeTextSegment(start_index=start, end_index=end)
+    return FakeGoogleLine(FakeLayout(FakeTextAnchor(text_segments=(segment,))))
+
+
+@pytest.fixture(scope="session")
+def fake_google_document() -> FakeGoogleDocument:
+    """A one-page Document stand-in whose lines index into its text."""
+    return FakeGoogleDocument(
+        text="Test Document Title\nThis is paragraph one.",
+        pages=(FakeGooglePage(lines=(_google_line(0, 19), _google_line(20, 42))),),
+    )
+
+
+def _stage_batch_output(storage_client, texts, shard_indexes):
+    """Serve batch output shards from a mocked storage client.
+
+    Each text becomes one Document JSON shard with a single line, listed
+    in the order given. Returns every blob under the job prefix: the
+    uploaded input, the shards, and a non-JSON blob that must be skipped.
+    """
+    from google.cloud import documentai_v1 as documentai
+
+    def blob(name, data=b""):
+        mock = MagicMock()
+        mock.name = name
+        mock.download_as_bytes.return_value = data
+        return mock
+
+    shards = []
+    for text, shard_index in zip(texts, shard_indexes, strict=True):
+        segment = documentai.Document.TextAnchor.TextSegment(end_index=len(text))
+        layout = documentai.Document.Page.Layout(
+            text_anchor=documentai.Document.TextAnchor(text_segments=[segment])
+        )
+        document = documentai.Document(
+            text=text,
+            pages=[documentai.Document.Page(lines=[{"layout": layout}])],
+            shard_info=documentai.Document.ShardInfo(shard_index=shard_index),
+        )
+        shards.append(
+            blob(
+                f"output/shard-{shard_index}.json",
+                documentai.Document.to_json(document).encode(),
+            )
+        )
+
+    input_blob = blob("input/stub.pdf")
+
+    def bucket_blob(name):
+        input_blob.name = name
+        return input_blob
+
+    storage_client.bucket.return_value.blob.side_effect = bucket_blob
+    other = [blob("output/manifest.txt")] if shards else []
+
+    def list_blobs(bucket_name, prefix):
+        if prefix.endswith("/output/"):
+            return shards + other
+        return [input_blob, *shards, *other]
+
+    storage_client.list_blobs.side_effect = list_blobs
+    return [input_blob, *shards, *other]
+
+
+@requires_google_docai
+class TestGoogleDocumentAIBackend:
+    """Tests for Google Document AI backend."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def docai_client_class(cls):
+        """DocumentProcessorServiceClient, patched once for the whole class."""
+        with patch(
+            "pdfsmith.backends.google_document_ai_backend.documentai.DocumentProcessorServiceClient"
+        ) as client_class:
+            yield client_class
+
+    @pytest.fixture(autouse=True)
+    def docai_client(self, docai_client_class):
+        """The mocked client every backend receives, reset between tests.
+
+        The client is reset in place so backends shared across tests keep
+        pointing at it.
+        """
+        docai_client_class.reset_mock()
+        client = docai_client_class.return_value
+        client.reset_mock(return_value=True, side_effect=True)
+        return client
+
+    @pytest.fixture
+    def storage_client(self):
+        """Mocked google.cloud.storage client used by batch processing."""
+        with patch(
+            "pdfsmith.backends.google_document_ai_backend.storage.Client"
+        ) as client_class:
+            yield client_class.return_value
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def gdocai_backend(cls, docai_client_class) -> GoogleDocumentAIBackend:
+        """One backend built from GOOGLE_ENV, shared by the whole class."""
+        with pytest.MonkeyPatch.context() as mp:
+            for key, value in GOOGLE_ENV.items():
+                mp.setenv(key, value)
+            mp.delenv("GOOGLE_DOCUMENT_AI_GCS_URI", raising=False)
+            return GoogleDocumentAIBackend()
+
+    @pytest.mark.parametrize("missing", list(GOOGLE_ENV))
+    def test_initialization_missing_env(self, monkeypatch, missing):
+        """Backend should name the required env var that is not set."""
+        for key, value in GOOGLE_ENV.items():
+            monkeypatch.setenv(key, value)
+        monkeypatch.delenv(missing)
+
+        with pytest.raises(RuntimeError, match=missing):
+            GoogleDocumentAIBackend()
+
+    def test_parse_with_mocked_client(
+        self,
+        sample_pdf: Path,
+        fake_google_document: FakeGoogleDocument,
+        docai_client,
+        gdocai_backend: GoogleDocumentAIBackend,
+    ):
+        """Backend should parse PDF with mocked client."""
+        docai_client.process_document.return_value.document = fake_google_document
+
+        result = gdocai_backend.parse(sample_pdf)
+
+        assert result == "Test Document Title\n\nThis is paragraph one."
+
+    def test_parse_page_limit_exceeded(
+        self, manypage_pdf: Path, gdocai_backend: GoogleDocumentAIBackend
+    ):
+        """Backend should raise ValueError for PDFs over 15 pages."""
+        pytest.importorskip("fitz")
+
+        # The real fitz will read the 20-page PDF and raise ValueError
+        with pytest.raises(ValueError, match="15 pages"):
+            gdocai_backend.parse(manypage_pdf)
+
+    @pytest.fixture
+    def gcs_backend(self, docai_client, monkeypatch) -> GoogleDocumentAIBackend:
+        """A backend with GCS staging configured, so it can batch."""
+        if not GOOGLE_STORAGE_AVAILABLE:
+            pytest.skip("google-cloud-storage not installed")
+
+        for key, value in GOOGLE_ENV.items():
+            monkeypatch.setenv(key, value)
+        monkeypatch.setenv("GOOGLE_DOCUMENT_AI_GCS_URI", "gs://test-bucket/pdfsmith")
+        return GoogleDocumentAIBackend()
+
+    def test_parse_page_limit_routes_to_batch(
+        self,
+        manypage_pdf: Path,
+        docai_client,
+        gcs_backend: GoogleDocumentAIBackend,
+    ):
+        """PDFs over 15 pages should use batch processing when GCS is set."""
+        pytest.importorskip("fitz")
+
+        with patch.object(
+            gcs_backend, "_parse_batch", return_value="Batch text"
+        ) as mock_batch:
+            result = gcs_backend.parse(manypage_pdf)
+
+        assert result == "Batch text"
+        mock_batch.assert_called_once_with(manypage_pdf, "gs://test-bucket/pdfsmith")
+        docai_client.process_document.assert_not_called()
+
+    def test_parse_size_limit_routes_to_batch(
+        self,
+        sample_pdf: Path,
+        tmp_path: Path,
+        docai_client,
+        gcs_backend: GoogleDocumentAIBackend,
+    ):
+        """PDFs over 20 MB should use batch processing when GCS is set."""
+        # Zero padding past %%EOF; the PDF stays readable for the page check
+        large_pdf = tmp_path / "large.pdf"
+        large_pdf.write_bytes(sample_pdf.read_bytes())
+        os.truncate(large_pdf, 25 * 1024 * 1024)
+
+        with patch.object(
+            gcs_backend, "_parse_batch", return_value="Batch text"
+        ) as mock_batch:
+            result = gcs_backend.parse(large_pdf)
+
+        assert result == "Batch text"
+        mock_batch.assert_called_once_with(large_pdf, "gs://test-bucket/pdfsmith")
+        docai_client.process_document.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "error,exc,match",
+        [
+            ("InvalidArgument", ValueError, "Invalid PDF"),
+            ("ResourceExhausted", RuntimeError, "rate limit"),
+            ("InternalServerError", RuntimeError, "Google Document AI error"),
+        ],
+        ids=["invalid-argument", "resource-exhausted", "other"],
+    )
+    def test_parse_error_mapping(
+        self,
+        sample_pdf: Path,
+        gdocai_backend: GoogleDocumentAIBackend,
+        error,
+        exc,
+        match,
+    ):
+        """Backend should map API error types to pdfsmith exceptions."""
+        from google.api_core import exceptions
+
+        gdocai_backend.client.process_document.side_effect = getattr(exceptions, error)(
+            "API error"
+        )
+
+        with pytest.raises(exc, match=match):
+            gdocai_backend.parse(sample_pdf)
+
+    @pytest.mark.parametrize(
+        "gcs_uri,bucket_name,prefix",
+        [
+            ("gs://test-bucket/pdfsmith/", "test-bucket", "pdfsmith/pdfsmith-"),
+            ("gs://test-bucket", "test-bucket", "pdfsmith-"),
+        ],
+        ids=["prefix", "bare-bucket"],
+    )
+    def test_parse_batch_reads_shards_in_order(
+        self,
+        stub_sample_pdf: Path,
+        gdocai_backend: GoogleDocumentAIBackend,
+        docai_client,
+        storage_client,
+        gcs_uri,
+        bucket_name,
+        prefix,
+    ):
+        """Batch output shards should be joined by shard_index, then deleted."""
+        blobs = _stage_batch_output(storage_client, ["second", "first"], [1, 0])
+
+        result = gdocai_backend._parse_batch(stub_sample_pdf, gcs_uri)
+
+        assert result == "first\n\nsecond"
+        storage_client.bucket.assert_called_once_with(bucket_name)
+        input_name = storage_client.bucket.return_value.blob.call_args.args[0]
+        assert input_name.startswith(prefix)
+        assert input_name.endswith("/input/stub.pdf")
+        request = docai_client.batch_process_documents.call_args.kwargs["request"]
+        document = request.input_documents.gcs_documents.documents[0]
+        assert document.gcs_uri == f"gs://{bucket_name}/{input_name}"
+        for blob in blobs:
+            blob.delete.assert_called_once_with()
+
+    def test_parse_batch_timeout(
+        self,
+        manypage_pdf: Path,
+        gcs_backend: GoogleDocumentAIBackend,
+        docai_client,
+        storage_client,
+    ):
+        """A batch operation that times out should raise RuntimeError."""
+        from concurrent.futures import TimeoutError as OperationTimeout
+
+        pytest.importorskip("fitz")
+
+        blobs = _stage_batch_output(storage_client, [], [])
+        operation = docai_client.batch_process_documents.return_value
+        operation.result.side_effect = OperationTimeout()
+
+        with pytest.raises(RuntimeError, match="^Batch processing did not finish"):
+            gcs_backend.parse(manypage_pdf)
+
+        for blob in blobs:
+            blob.delete.assert_called_once_with()
+
+    def test_parse_batch_failed_document(
+        self,
+        stub_sample_pdf: Path,
+        gdocai_backend: GoogleDocumentAIBackend,
+        docai_client,
+        storage_client,
+    ):
+        """A document that failed in the batch should raise its status message."""
+        _stage_batch_output(storage_client, [], [])
+        operation = docai_client.batch_process_documents.return_value
+        operation.metadata.individual_process_statuses = [
+            SimpleNamespace(status=SimpleNamespace(code=3, message="Unsupported file"))
+        ]
+
+        with pytest.raises(RuntimeError, match="Unsupported file"):
+            gdocai_backend._parse_batch(stub_sample_pdf, "gs://test-bucket")
+
+    def test_parse_batch_no_output(
+        self,
+        stub_sample_pdf: Path,
+        gdocai_backend: GoogleDocumentAIBackend,
+        storage_client,
+    ):
+        """A batch that leaves no output documents should not return ""."""
+        _stage_batch_output(storage_client, [], [])
+
+        with pytest.raises(RuntimeError, match="no output documents"):
+            gdocai_backend._parse_batch(stub_sample_pdf, "gs://test-bucket")
+
+    def test_parse_batch_cleanup_error_keeps_batch_error(
+        self,
+        stub_sample_pdf: Path,
+        gdocai_backend: GoogleDocumentAIBackend,
+        docai_client,
+        storage_client,
+    ):
+        """A failed blob delete should not replace the batch error."""
+        from google.api_core.exceptions import InternalServerError
+
+        (blob,) = _stage_batch_output(storage_client, [], [])
+        blob.delete.side_effect = InternalServerError("delete failed")
+        docai_client.batch_process_documents.side_effect = InternalServerError(
+            "batch failed"
+        )
+
+        with pytest.raises(InternalServerError, match="batch failed"):
+            gdocai_backend._parse_batch(stub_sample_pdf, "gs://test-bucket")
+
+    def test_extract_text_empty_pages(self, gdocai_backend: GoogleDocumentAIBackend):
+        """_extract_text should handle empty document."""
+        # Test with None pages
+        assert gdocai_backend._extract_text(FakeGoogleDocument(pages=None)) == ""
+
+        # Test with empty pages
+        assert gdocai_backend._extract_text(FakeGoogleDocument(pages=())) == ""
+
+    def test_get_text_from_layout_no_anchor(
+        self, gdocai_backend: GoogleDocumentAIBackend
+    ):
+        """_get_text_from_layout should handle missing text_anchor."""
+        # Test with no text_anchor
+        layout = FakeLayout(text_anchor=None)
+        assert gdocai_backend._get_text_from_layout(layout, "test") == ""
+
+        # Test with no text_segments
+        layout = FakeLayout(FakeTextAnchor(text_segments=None))
+        assert gdocai_backend._get_text_from_layout(layout, "test") == ""